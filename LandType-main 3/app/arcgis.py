@@ -2,13 +2,29 @@
 from __future__ import annotations
 
 import json
+import math
 import re
-from typing import Any, Dict, Iterable, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+from .cache import TTLCache
 from .config import (
+    ARCGIS_CACHE_MAXBYTES,
+    ARCGIS_CACHE_MAXSIZE,
+    ARCGIS_CACHE_TTL,
     ARCGIS_MAX_RECORDS,
+    ARCGIS_POOL_MAXSIZE,
+    ARCGIS_TILE_MAX_GRID,
+    ARCGIS_TILE_SIZE_M,
     ARCGIS_TIMEOUT,
     BORE_DRILL_DATE_FIELD,
     BORE_LAYER_ID,
@@ -49,6 +65,52 @@ from .bores import (
 )
 
 
+_QUERY_CACHE = TTLCache(maxsize=ARCGIS_CACHE_MAXSIZE, ttl=ARCGIS_CACHE_TTL, maxbytes=ARCGIS_CACHE_MAXBYTES)
+_TILE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=ARCGIS_TILE_MAX_GRID * ARCGIS_TILE_MAX_GRID, thread_name_prefix="arcgis-tile"
+)
+
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Process-wide session so ArcGIS calls reuse pooled keep-alive connections."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                sess = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=ARCGIS_POOL_MAXSIZE,
+                    pool_maxsize=ARCGIS_POOL_MAXSIZE,
+                )
+                sess.mount("https://", adapter)
+                sess.mount("http://", adapter)
+                _SESSION = sess
+    return _SESSION
+
+
+def _response_json(r) -> Any:
+    content = getattr(r, "content", None)
+    if orjson is not None and isinstance(content, (bytes, bytearray)):
+        return orjson.loads(content)
+    return r.json()
+
+
+def _dump_cached(fc: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(fc)
+    return json.dumps(fc).encode("utf-8")
+
+
+def _load_cached(blob: bytes) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+
 def _layer_query_url(service_url: str, layer_id: int) -> str:
     return f"{service_url.rstrip('/')}/{int(layer_id)}/query"
 
@@ -72,7 +134,20 @@ def _arcgis_geojson_query(service_url: str, layer_id: int, params: Dict[str, Any
     result_offset: int = int(base.pop("resultOffset", 0))
     result_record_count: int = int(base.pop("resultRecordCount", ARCGIS_MAX_RECORDS))
 
-    sess = requests.Session()
+    # Callers mutate the returned properties, so the cache holds serialized bytes and
+    # every hit parses its own copy (cheaper than deep-copying the nested dicts).
+    cache_key = (
+        url,
+        tuple(sorted((str(k), str(v)) for k, v in base.items())),
+        result_offset,
+        result_record_count,
+        bool(paginate),
+    )
+    cached = _QUERY_CACHE.get(cache_key)
+    if cached is not None:
+        return _load_cached(cached)
+
+    sess = _get_session()
     out_fc: Dict[str, Any] = {}
     while True:
         q = dict(base)
@@ -80,7 +155,7 @@ def _arcgis_geojson_query(service_url: str, layer_id: int, params: Dict[str, Any
         q["resultRecordCount"] = result_record_count
         r = sess.get(url, params=q, timeout=ARCGIS_TIMEOUT)
         r.raise_for_status()
-        fc = r.json()
+        fc = _response_json(r)
         _ensure_fc(fc)
         out_fc = _merge_fc(out_fc, fc)
         feats = fc.get("features", [])
@@ -90,6 +165,7 @@ def _arcgis_geojson_query(service_url: str, layer_id: int, params: Dict[str, Any
             break
     if not out_fc:
         out_fc = {"type": "FeatureCollection", "features": []}
+    _QUERY_CACHE.set(cache_key, _dump_cached(out_fc))
     return out_fc
 
 _LOTPLAN_RE = re.compile(
@@ -213,36 +289,104 @@ def _standardise_code_name(fc: Dict[str, Any], code_field: str, name_field: str)
         out.append({"type":"Feature","geometry":f.get("geometry"),"properties":p})
     return {"type":"FeatureCollection","features":out}
 
+def _envelope_geometry_json(env_3857) -> str:
+    # Rounded to the centimetre so repeat exports of a parcel share a cache key.
+    xmin, ymin, xmax, ymax = (round(float(v), 2) for v in env_3857)
+    geometry = {"xmin": xmin, "ymin": ymin, "xmax": xmax, "ymax": ymax, "spatialReference": {"wkid": 3857}}
+    return json.dumps(geometry)
+
+def tile_envelope(env_3857, n: int) -> List[Tuple[float, float, float, float]]:
+    """Split an envelope into an ``n`` x ``n`` grid of sub-envelopes."""
+    xmin, ymin, xmax, ymax = (float(v) for v in env_3857)
+    n = max(1, int(n))
+    xs = [xmin + (xmax - xmin) * i / n for i in range(n)] + [xmax]
+    ys = [ymin + (ymax - ymin) * j / n for j in range(n)] + [ymax]
+    return [(xs[i], ys[j], xs[i + 1], ys[j + 1]) for j in range(n) for i in range(n)]
+
+def _envelope_grid_size(env_3857) -> int:
+    xmin, ymin, xmax, ymax = (float(v) for v in env_3857)
+    span = max(xmax - xmin, ymax - ymin)
+    if ARCGIS_TILE_SIZE_M <= 0 or span <= ARCGIS_TILE_SIZE_M:
+        return 1
+    return min(ARCGIS_TILE_MAX_GRID, int(math.ceil(span / ARCGIS_TILE_SIZE_M)))
+
+def _feature_object_id(feature: Dict[str, Any]) -> Optional[Any]:
+    fid = feature.get("id")
+    if fid is not None:
+        return fid
+    props = feature.get("properties") or {}
+    return props.get("OBJECTID", props.get("objectid"))
+
+def _feature_content_key(feature: Dict[str, Any]) -> bytes:
+    """Identity for features without an id: their geometry and properties, serialized canonically."""
+    content = {"geometry": feature.get("geometry"), "properties": feature.get("properties")}
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(content, sort_keys=True).encode("utf-8")
+
+def _merge_tiles(fcs: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    seen = set()
+    # Features without an id are matched on content, and only against earlier tiles,
+    # so identical features within one tile's response are all kept.
+    seen_content: set = set()
+    features: List[Dict[str, Any]] = []
+    for fc in fcs:
+        tile_content = set()
+        for feature in fc.get("features", []):
+            oid = _feature_object_id(feature)
+            if oid is not None:
+                if oid in seen:
+                    continue
+                seen.add(oid)
+            else:
+                key = _feature_content_key(feature)
+                if key in seen_content:
+                    continue
+                tile_content.add(key)
+            features.append(feature)
+        seen_content |= tile_content
+    return {"type": "FeatureCollection", "features": features}
+
+def _envelope_query(service_url: str, layer_id: int, params: Dict[str, Any], env_3857) -> Dict[str, Any]:
+    """Query features intersecting an envelope, tiling large envelopes across threads."""
+    base = dict(params)
+    base.update(
+        {
+            "geometryType": "esriGeometryEnvelope",
+            "inSR": 3857,
+            "spatialRel": "esriSpatialRelIntersects",
+            "returnExceededLimitFeatures": "true",
+        }
+    )
+
+    def _query(env) -> Dict[str, Any]:
+        q = dict(base)
+        q["geometry"] = _envelope_geometry_json(env)
+        return _arcgis_geojson_query(service_url, layer_id, q, paginate=True)
+
+    n = _envelope_grid_size(env_3857)
+    if n <= 1:
+        return _query(env_3857)
+    return _merge_tiles(_TILE_EXECUTOR.map(_query, tile_envelope(env_3857, n)))
+
 def fetch_landtypes_intersecting_envelope(env_3857) -> Dict[str, Any]:
     if not LANDTYPES_SERVICE_URL or LANDTYPES_LAYER_ID < 0:
         raise RuntimeError("Land Types service not configured.")
-    xmin, ymin, xmax, ymax = env_3857
-    geometry = {"xmin": float(xmin),"ymin": float(ymin), "xmax": float(xmax),"ymax": float(ymax), "spatialReference":{"wkid":3857}}
     params = {
         "where": "1=1",
-        "geometry": json.dumps(geometry),
-        "geometryType": "esriGeometryEnvelope",
-        "inSR": 3857,
-        "spatialRel": "esriSpatialRelIntersects",
         "outFields": "*",
         "outSR": 4326,
     }
-    fc = _arcgis_geojson_query(LANDTYPES_SERVICE_URL, LANDTYPES_LAYER_ID, params, paginate=True)
+    fc = _envelope_query(LANDTYPES_SERVICE_URL, LANDTYPES_LAYER_ID, params, env_3857)
     return _standardise_code_name(fc, LANDTYPES_CODE_FIELD, LANDTYPES_NAME_FIELD)
 
 def fetch_features_intersecting_envelope(service_url: str, layer_id: int, env_3857, out_sr: int = 4326, out_fields: str = "*", where: str = "1=1") -> Dict[str, Any]:
-    xmin, ymin, xmax, ymax = env_3857
-    geometry = {"xmin": float(xmin),"ymin": float(ymin), "xmax": float(xmax),"ymax": float(ymax), "spatialReference":{"wkid":3857}}
     params = {
         "where": where or "1=1",
-        "geometry": json.dumps(geometry),
-        "geometryType": "esriGeometryEnvelope",
-        "inSR": 3857,
-        "spatialRel": "esriSpatialRelIntersects",
         "outFields": out_fields or "*",
         "outSR": out_sr,
     }
-    return _arcgis_geojson_query(service_url, int(layer_id), params, paginate=True)
+    return _envelope_query(service_url, int(layer_id), params, env_3857)
 
 
 def _join_fields(fields: Iterable[str]) -> str:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
 import datetime as dt
 from dataclasses import dataclass
 from typing import Any, Dict, Mapping, Optional, Tuple, cast
@@ -89,6 +91,8 @@ class BoreIconDefinition:
 
 _ICON_BY_PAIR: Dict[Tuple[str, str], BoreIconDefinition] = {}
 _ICON_BY_KEY: Dict[str, BoreIconDefinition] = {}
+# Decoded once at import; bores reference a handful of icons many times over.
+_ICON_BYTES_BY_KEY: Dict[str, bytes] = {}
 
 for (status, bore_type), meta in BORE_ICON_MAP.items():
     status_norm = _clean_code(status)
@@ -105,6 +109,13 @@ for (status, bore_type), meta in BORE_ICON_MAP.items():
     _ICON_BY_PAIR[pair_key] = definition
     if definition.key:
         _ICON_BY_KEY[definition.key] = definition
+        if definition.image_data:
+            try:
+                icon_bytes = base64.b64decode(definition.image_data)
+            except (binascii.Error, ValueError):
+                icon_bytes = b""
+            if icon_bytes:
+                _ICON_BYTES_BY_KEY[definition.key] = icon_bytes
 
 
 def get_bore_icon(status_code: str, bore_type_code: str) -> Optional[BoreIconDefinition]:
@@ -124,10 +135,20 @@ def get_bore_icon_by_key(icon_key: str) -> Optional[BoreIconDefinition]:
     return _ICON_BY_KEY.get(key)
 
 
+def get_bore_icon_bytes(icon_key: str) -> Optional[bytes]:
+    """Return the decoded image bytes for an icon key, if the icon embeds any."""
+
+    key = _clean_code(icon_key)
+    if not key:
+        return None
+    return _ICON_BYTES_BY_KEY.get(key)
+
+
 __all__ = [
     "BoreIconDefinition",
     "get_bore_icon",
     "get_bore_icon_by_key",
+    "get_bore_icon_bytes",
     "make_bore_icon_key",
     "normalize_bore_drill_date",
     "normalize_bore_number",
@@ -0,0 +1,83 @@
+# app/cache.py
+"""Small thread-safe in-process TTL cache."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """LRU-bounded mapping whose entries expire ``ttl`` seconds after insertion.
+
+    With ``maxbytes`` set, values must support ``len()`` (e.g. serialized ``bytes``)
+    and least recently used entries are also evicted to keep their total under it.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300.0, maxbytes: Optional[int] = None) -> None:
+        self.maxsize = max(1, int(maxsize))
+        self.ttl = float(ttl)
+        self.maxbytes = None if maxbytes is None else max(1, int(maxbytes))
+        self._data: "OrderedDict[Hashable, Tuple[float, Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            stamp, value, size = entry
+            if now - stamp > self.ttl:
+                del self._data[key]
+                self._bytes -= size
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        size = len(value) if self.maxbytes is not None else 0
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            if self.maxbytes is not None and size > self.maxbytes:
+                return
+            self._data[key] = (time.monotonic(), value, size)
+            self._bytes += size
+            while len(self._data) > self.maxsize or (
+                self.maxbytes is not None and self._bytes > self.maxbytes
+            ):
+                _key, (_stamp, _value, evicted) = self._data.popitem(last=False)
+                self._bytes -= evicted
+
+    def purge(self) -> int:
+        """Drop expired entries and return how many were removed."""
+
+        cutoff = time.monotonic() - self.ttl
+        with self._lock:
+            stale = [key for key, (stamp, _value, _size) in self._data.items() if stamp < cutoff]
+            for key in stale:
+                self._bytes -= self._data.pop(key)[2]
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Total ``len()`` of the cached values (0 unless ``maxbytes`` is set)."""
+        with self._lock:
+            return self._bytes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+__all__ = ["TTLCache"]
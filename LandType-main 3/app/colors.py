@@ -1,9 +1,11 @@
 # app/colors.py
 import hashlib
+from functools import lru_cache
 from typing import Tuple
 
 
 # Deterministic color from code string; returns (R,G,B) 0-255
+@lru_cache(maxsize=4096)
 def color_from_code(code: str) -> Tuple[int,int,int]:
     s = (code or "UNK").encode("utf-8")
     h = hashlib.sha1(s).hexdigest()
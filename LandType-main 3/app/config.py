@@ -430,3 +430,19 @@ WATER_LAYER_TITLES = {layer_id: meta["title"] for layer_id, meta in WATER_LAYER_
 # ── HTTP / paging
 ARCGIS_TIMEOUT = 45          # seconds
 ARCGIS_MAX_RECORDS = 2000    # per page (server permits this on these layers)
+ARCGIS_FETCH_WORKERS = 16    # threads used to issue independent layer queries concurrently
+BULK_LOT_WORKERS = 8         # lots fetched side by side by the bulk endpoints
+BULK_BATCH_MAX_SPAN_M = 20000  # lots within this EPSG:3857 extent share one query per layer
+ARCGIS_POOL_MAXSIZE = 32     # keep-alive connections kept per ArcGIS host
+ARCGIS_TILE_SIZE_M = 10000   # envelopes wider/taller than this (EPSG:3857 metres) are split into tiles
+ARCGIS_TILE_MAX_GRID = 4     # at most an N×N grid of tiles per envelope query
+
+# ── Response cache (in-process, per worker)
+ARCGIS_CACHE_TTL = 300       # seconds a cached ArcGIS query stays fresh
+ARCGIS_CACHE_MAXSIZE = 512   # distinct queries kept before LRU eviction
+ARCGIS_CACHE_MAXBYTES = 256 * 1024 * 1024  # serialized responses kept per process before LRU eviction
+REPORT_CACHE_MAXSIZE = 64    # built property reports (per lot + export options) kept for re-export
+
+# ── Response compression
+GZIP_MINIMUM_SIZE = 1024     # bytes; smaller responses are sent as-is
+GZIP_COMPRESS_LEVEL = 5      # zlib level for JSON/HTML responses
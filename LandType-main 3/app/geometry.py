@@ -1,12 +1,18 @@
 # app/geometry.py
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple, cast
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, cast
 
+import numpy as np
+import shapely
 from pyproj import Transformer
 from shapely.geometry import GeometryCollection, shape
 from shapely.ops import transform as shp_transform
 from shapely.ops import unary_union
+from shapely.prepared import prep
+from shapely.strtree import STRtree
 from shapely.validation import make_valid
 
 
@@ -14,23 +20,149 @@ def to_shapely_union(fc: Dict[str, Any]):
     geoms: List[Any] = []
     for f in (fc or {}).get("features", []):
         try:
-            g = shape(f.get("geometry"))
-            if not g.is_empty:
-                geoms.append(g)
+            geoms.append(shape(f.get("geometry")))
         except Exception:
             continue
-    if not geoms: return GeometryCollection()
+    arr = np.asarray(geoms, dtype=object)
+    if arr.size:
+        arr = arr[~shapely.is_empty(arr)]
+    if not arr.size: return GeometryCollection()
+    # One GEOS union over the whole array rather than per-geometry Python work.
     try:
-        return unary_union(geoms)
+        return shapely.union_all(arr)
     except Exception:
-        geoms2 = [make_valid(g) for g in geoms]
-        return unary_union(geoms2)
+        return shapely.union_all(shapely.make_valid(arr))
+
+@dataclass(frozen=True)
+class ParcelIndex:
+    """Parcel union with an STRtree over its parts, built once per parcel."""
+
+    union: Any
+    parts: Tuple[Any, ...]
+    tree: STRtree
+    prepared: Any
+    bounds: Tuple[float, float, float, float]
+
+    def envelope_misses(self, geom) -> bool:
+        """True when ``geom``'s bounding box cannot overlap the parcel's."""
+        gxmin, gymin, gxmax, gymax = geom.bounds
+        pxmin, pymin, pxmax, pymax = self.bounds
+        return gxmax < pxmin or gxmin > pxmax or gymax < pymin or gymin > pymax
+
+    def candidates(self, geom):
+        """Return the parcel parts whose envelopes meet ``geom`` (None when none do)."""
+        hits = self.tree.query(geom)
+        if len(hits) == 0:
+            return None
+        if len(hits) == len(self.parts):
+            return self.union
+        if len(hits) == 1:
+            return self.parts[int(hits[0])]
+        return unary_union([self.parts[int(i)] for i in hits])
+
+    def intersection(self, geom):
+        target = self.candidates(geom)
+        if target is None:
+            return GeometryCollection()
+        return target.intersection(geom)
+
+def build_parcel_index(parcel_union) -> Optional[ParcelIndex]:
+    if parcel_union is None or parcel_union.is_empty:
+        return None
+    parts = tuple(
+        part for part in getattr(parcel_union, "geoms", [parcel_union]) if not part.is_empty
+    )
+    if not parts:
+        return None
+    return ParcelIndex(
+        union=parcel_union,
+        parts=parts,
+        tree=STRtree(parts),
+        prepared=prep(parcel_union),
+        bounds=tuple(float(v) for v in parcel_union.bounds),
+    )
+
+def total_bounds(geoms) -> Optional[Tuple[float, float, float, float]]:
+    """Combined (minx, miny, maxx, maxy) of ``geoms`` from one vectorized bounds call."""
+    arr = np.asarray(list(geoms), dtype=object)
+    if arr.size == 0:
+        return None
+    bounds = shapely.bounds(arr)
+    if np.isnan(bounds).all():
+        return None
+    return (
+        float(np.nanmin(bounds[:, 0])),
+        float(np.nanmin(bounds[:, 1])),
+        float(np.nanmax(bounds[:, 2])),
+        float(np.nanmax(bounds[:, 3])),
+    )
+
+def _iter_position_lists(coords):
+    """Yield the innermost position lists (rings, lines, point sets) of nested GeoJSON coordinates."""
+    if not coords:
+        return
+    first = coords[0]
+    if isinstance(first, (int, float)):
+        yield [coords]
+        return
+    if not isinstance(first, (list, tuple)):
+        raise TypeError(f"unexpected GeoJSON coordinate {first!r}")
+    if first and isinstance(first[0], (int, float)):
+        yield coords
+        return
+    for item in coords:
+        yield from _iter_position_lists(item)
+
+def geojson_bounds(geometry: Dict[str, Any]) -> Optional[Tuple[float, float, float, float]]:
+    """Bounds of a GeoJSON geometry straight from its coordinates (no shapely object).
+
+    Each ring or line is converted to an array in one numpy call and reduced there.
+    """
+    if not geometry:
+        return None
+    if geometry.get("type") == "GeometryCollection":
+        parts = [geojson_bounds(g) for g in geometry.get("geometries") or []]
+        parts = [b for b in parts if b is not None]
+        if not parts:
+            return None
+        return total_bounds_of(parts)
+    boxes = []
+    try:
+        for positions in _iter_position_lists(geometry.get("coordinates")):
+            try:
+                xy = np.asarray(positions, dtype=np.float64)[:, :2]
+            except ValueError:
+                # Ragged positions (mixed 2D/3D); trim each to x, y.
+                xy = np.asarray([pos[:2] for pos in positions], dtype=np.float64)
+            if xy.size == 0:
+                continue
+            mins = xy.min(axis=0)
+            maxs = xy.max(axis=0)
+            boxes.append((mins[0], mins[1], maxs[0], maxs[1]))
+    except (TypeError, ValueError, IndexError):
+        return None
+    if not boxes:
+        return None
+    return total_bounds_of(boxes)
+
+def total_bounds_of(bounds: List[Tuple[float, float, float, float]]) -> Tuple[float, float, float, float]:
+    arr = np.asarray(bounds, dtype=np.float64)
+    return (
+        float(arr[:, 0].min()),
+        float(arr[:, 1].min()),
+        float(arr[:, 2].max()),
+        float(arr[:, 3].max()),
+    )
+
+@lru_cache(maxsize=None)
+def _transformer(src_epsg: int, dst_epsg: int) -> Transformer:
+    return Transformer.from_crs(src_epsg, dst_epsg, always_xy=True)
 
 def bbox_3857(geom4326) -> Tuple[float,float,float,float]:
     if geom4326.is_empty:
         return (0,0,0,0)
     minx, miny, maxx, maxy = geom4326.bounds
-    tr = Transformer.from_crs(4326, 3857, always_xy=True)
+    tr = _transformer(4326, 3857)
     x1, y1 = tr.transform(minx, miny)
     x2, y2 = tr.transform(maxx, maxy)
     xmin, xmax = sorted((x1, x2))
@@ -40,21 +172,47 @@ def bbox_3857(geom4326) -> Tuple[float,float,float,float]:
 def shapely_transform(geom, transformer: Transformer):
     return shp_transform(lambda x, y, z=None: transformer.transform(x, y), geom)
 
-def _area_ha(geom4326) -> float:
+def _project_array(geoms: np.ndarray, transformer: Transformer) -> np.ndarray:
+    """Reproject every geometry in ``geoms`` with one pyproj call over all their coordinates."""
+    def _xy(coords: np.ndarray) -> np.ndarray:
+        x, y = transformer.transform(coords[:, 0], coords[:, 1])
+        return np.column_stack((x, y))
+    return shapely.transform(geoms, _xy)
+
+def _areas_ha(geoms4326: np.ndarray) -> np.ndarray:
     # Use equal-area CRS for area
-    tr = Transformer.from_crs(4326, 6933, always_xy=True)
     try:
-        g_eq = shapely_transform(geom4326, tr)
-        return abs(g_eq.area) / 10000.0
+        areas = shapely.area(_project_array(geoms4326, _transformer(4326, 6933)))
+        if np.isfinite(areas).all():
+            return np.abs(areas) / 10000.0
     except Exception:
-        tr2 = Transformer.from_crs(4326, 3857, always_xy=True)
-        g2 = shapely_transform(geom4326, tr2)
-        return abs(g2.area) / 10000.0
+        pass
+    areas = shapely.area(_project_array(geoms4326, _transformer(4326, 3857)))
+    return np.abs(areas) / 10000.0
+
+def _clip_array(geoms: np.ndarray, index: ParcelIndex) -> np.ndarray:
+    """Intersect ``geoms`` with the parcel in one GEOS pass, repairing invalid inputs on failure."""
+    try:
+        return shapely.intersection(geoms, index.union)
+    except Exception:
+        pass
+    clipped = np.empty(len(geoms), dtype=object)
+    for i, g in enumerate(geoms):
+        try:
+            clipped[i] = index.intersection(g)
+        except Exception:
+            try:
+                clipped[i] = index.intersection(make_valid(g))
+            except Exception:
+                clipped[i] = None
+    return clipped
 
 def prepare_clipped_shapes(parcel_fc: Dict[str, Any], thematic_fc: Dict[str, Any]) -> List[tuple]:
     parcel_u = to_shapely_union(parcel_fc)
-    if parcel_u.is_empty: return []
-    out: List[tuple] = []
+    index = build_parcel_index(parcel_u)
+    if index is None: return []
+    geoms: List[Any] = []
+    keys: List[Tuple[str, str]] = []
     for f in (thematic_fc or {}).get("features", []):
         props = f.get("properties") or {}
         code = str(props.get("code") or props.get("CODE") or props.get("MAP_CODE") or props.get("CLASS_CODE") or props.get("lt_code_1") or "UNK")
@@ -64,33 +222,41 @@ def prepare_clipped_shapes(parcel_fc: Dict[str, Any], thematic_fc: Dict[str, Any
         except Exception:
             continue
         if g.is_empty: continue
-        try:
-            inter = parcel_u.intersection(g)
-        except Exception:
-            try:
-                inter = parcel_u.intersection(make_valid(g))
-            except Exception:
-                continue
-        if inter.is_empty: continue
-        out.append((inter, code, name, float(_area_ha(inter))))
+        geoms.append(g)
+        keys.append((code, name))
+    if not geoms:
+        return []
+
+    arr = np.asarray(geoms, dtype=object)
+    # Drop features whose envelope cannot reach the parcel before any GEOS overlay work.
+    b = shapely.bounds(arr)
+    pxmin, pymin, pxmax, pymax = index.bounds
+    near = ~((b[:, 2] < pxmin) | (b[:, 0] > pxmax) | (b[:, 3] < pymin) | (b[:, 1] > pymax))
+    idx = np.flatnonzero(near)
+    if idx.size == 0:
+        return []
+    inter = _clip_array(arr[idx], index)
+    keep = np.fromiter((g is not None for g in inter), dtype=bool, count=len(inter))
+    keep[keep] = ~shapely.is_empty(inter[keep])
+    idx, inter = idx[keep], inter[keep]
+    if idx.size == 0:
+        return []
+    areas = _areas_ha(inter)
+
     # dissolve by code+name
     aggregated: Dict[Tuple[str, str], Dict[str, Any]] = {}
-    for g, c, n, a in out:
-        key = (c, n)
-        entry = aggregated.setdefault(key, {"geom": None, "area": 0.0})
-        geom_existing = entry.get("geom")
-        if geom_existing is None:
-            entry["geom"] = g
-        else:
-            entry["geom"] = geom_existing.union(g)
-        entry["area"] = float(entry.get("area", 0.0)) + float(a)
+    for i, g, a in zip(idx.tolist(), inter, areas.tolist()):
+        entry = aggregated.setdefault(keys[i], {"geoms": [], "area": 0.0})
+        entry["geoms"].append(g)
+        entry["area"] += a
 
     final = []
     for (code, name), entry in aggregated.items():
-        geom_obj = entry.get("geom")
+        parts = entry["geoms"]
+        geom_obj = parts[0] if len(parts) == 1 else unary_union(parts)
         if geom_obj is None or getattr(geom_obj, "is_empty", False):
             continue
-        final.append((geom_obj, code, name, float(entry.get("area", 0.0))))
+        final.append((geom_obj, code, name, float(entry["area"])))
     return final
 
 def merge_clipped_shapes_across_lots(all_clipped_data: List[List[tuple]]) -> List[tuple]:
@@ -3,8 +3,8 @@ from __future__ import annotations
 
 import html
 from dataclasses import dataclass
-from typing import Any, Callable, Iterable, Mapping, Optional, Sequence, Tuple, cast
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import IO, Any, Callable, Iterable, Iterator, Mapping, Optional, Sequence, Tuple, Union, cast
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
 
 try:
     from shapely.geometry import (
@@ -227,7 +227,9 @@ def build_kml(
     **kwargs,
 ) -> str:
     folder_label = html.escape(folder_name or "Export")
-    point_list = list(point_placemarks or [])
+    point_list = (
+        point_placemarks if isinstance(point_placemarks, (list, tuple)) else list(point_placemarks or [])
+    )
     point_styles = _collect_point_styles(point_list)
 
     styles: dict[str, str] = {}
@@ -298,13 +300,13 @@ def build_kml(
 def _unpack_group(
     group: Any,
 ) -> tuple[
-    list[Any],
+    Sequence[Any],
     Optional[Callable[[str], Tuple[int, int, int]]],
     Optional[str],
-    list[PointPlacemark],
-    list[Any],
+    Sequence[PointPlacemark],
+    Sequence[Any],
 ]:
-    clipped: list[Any] = []
+    clipped: Sequence[Any] = []
     color_fn: Optional[Callable[[str], Tuple[int, int, int]]] = None
     folder_name: Optional[str] = None
     point_data: Optional[Iterable[PointPlacemark]] = None
@@ -324,8 +326,9 @@ def _unpack_group(
     else:
         clipped = group
 
-    points = list(point_data or [])
-    nested = list(children or [])
+    # Groups are only iterated, so tuples and lists are passed through without copying.
+    points = point_data if isinstance(point_data, (list, tuple)) else list(point_data or [])
+    nested = children if isinstance(children, (list, tuple)) else list(children or [])
     return clipped, color_fn, folder_name, points, nested
 
 
@@ -458,12 +461,89 @@ def build_kml_nested_folders(
     )
     return kml
 
-def write_kmz(kml_text: str, out_path: str, assets: Optional[Mapping[str, bytes]] = None) -> None:
-    kml_bytes = kml_text.encode("utf-8")
-    with ZipFile(out_path, "w", compression=ZIP_DEFLATED) as zf:
-        zf.writestr("doc.kml", kml_bytes)
-        if assets:
-            for name, data in assets.items():
-                if not name or data is None:
-                    continue
+_KMZ_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def _kmz_entry(name: str, compress_type: int) -> ZipInfo:
+    # Fixed timestamp: entries never need an mtime, and it keeps archives reproducible.
+    info = ZipInfo(filename=name, date_time=_KMZ_DATE_TIME)
+    info.compress_type = compress_type
+    info.external_attr = 0o600 << 16
+    return info
+
+
+def _write_kmz_entries(zf: ZipFile, kml_text: str, assets: Optional[Mapping[str, bytes]]) -> Iterator[None]:
+    zf.writestr(_kmz_entry("doc.kml", ZIP_DEFLATED), kml_text.encode("utf-8"))
+    yield None
+    if assets:
+        # Icon assets are PNGs that are already compressed; store them as-is.
+        for name, data in assets.items():
+            if not name or data is None:
+                continue
+            zf.writestr(_kmz_entry(name, ZIP_STORED), data)
+            yield None
+
+
+def write_kmz(kml_text: str, out_path: Union[str, IO[bytes]], assets: Optional[Mapping[str, bytes]] = None) -> None:
+    with ZipFile(out_path, "w", compression=ZIP_DEFLATED, allowZip64=False) as zf:
+        for _ in _write_kmz_entries(zf, kml_text, assets):
+            pass
+
+
+class _ChunkSink:
+    """Write-only, non-seekable file object that buffers zip output between yields."""
+
+    def __init__(self) -> None:
+        self._chunks: list = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        out = b"".join(self._chunks)
+        self._chunks.clear()
+        return out
+
+
+def iter_kmz(kml_text: str, assets: Optional[Mapping[str, bytes]] = None) -> Iterator[bytes]:
+    """Yield a KMZ archive chunk by chunk without buffering the whole file."""
+    sink = _ChunkSink()
+    with ZipFile(cast(Any, sink), "w", compression=ZIP_DEFLATED, allowZip64=False) as zf:
+        for _ in _write_kmz_entries(zf, kml_text, assets):
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    chunk = sink.drain()
+    if chunk:
+        yield chunk
+
+
+def iter_zip(entries: Iterable[Tuple[str, Union[bytes, Iterable[bytes]]]]) -> Iterator[bytes]:
+    """Yield a zip of ``(name, data)`` entries chunk by chunk as each entry is written.
+
+    ``data`` is bytes or an iterable of byte chunks (such as ``iter_kmz``), which is
+    copied into the entry as it is produced. Entries are stored uncompressed; callers
+    pass already-compressed payloads such as KMZs.
+    """
+    sink = _ChunkSink()
+    with ZipFile(cast(Any, sink), "w", compression=ZIP_STORED) as zf:
+        for name, data in entries:
+            if isinstance(data, (bytes, bytearray, memoryview)):
                 zf.writestr(name, data)
+            else:
+                with zf.open(name, "w") as entry:
+                    for part in data:
+                        entry.write(part)
+                        chunk = sink.drain()
+                        if chunk:
+                            yield chunk
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    chunk = sink.drain()
+    if chunk:
+        yield chunk
@@ -1,27 +1,39 @@
 # app/main.py
 import base64
-import binascii
 import csv
 import datetime as dt
+import hashlib
+import heapq
 import html
 import io
+import json
 import logging
 import math
 import os
-import tempfile
-import zipfile
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, replace
+from functools import lru_cache, partial
 from io import BytesIO
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
 from urllib.parse import quote
 
-from fastapi import Body, FastAPI, HTTPException, Query, Response
+import numpy as np
+import shapely
+from fastapi import Body, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from starlette.datastructures import MutableHeaders
 from pydantic import BaseModel, Field
-from shapely.geometry import mapping as shp_mapping, shape as shp_shape
 from shapely.validation import make_valid
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 from .arcgis import (
     fetch_bores_intersecting_envelope,
     fetch_easements_intersecting_envelope,
@@ -32,7 +44,12 @@ from .arcgis import (
     normalize_lotplan,
 )
 from .colors import color_from_code
+from .cache import TTLCache
 from .config import (
+    ARCGIS_CACHE_TTL,
+    ARCGIS_FETCH_WORKERS,
+    BULK_BATCH_MAX_SPAN_M,
+    BULK_LOT_WORKERS,
     BORE_DRILL_DATE_FIELD,
     BORE_NUMBER_FIELD,
     BORE_REPORT_URL_FIELD,
@@ -45,6 +62,9 @@ from .config import (
     EASEMENT_LOTPLAN_FIELD,
     EASEMENT_PARCEL_TYPE_FIELD,
     EASEMENT_TENURE_FIELD,
+    GZIP_COMPRESS_LEVEL,
+    GZIP_MINIMUM_SIZE,
+    REPORT_CACHE_MAXSIZE,
     VEG_CODE_FIELD_DEFAULT,
     VEG_LAYER_ID_DEFAULT,
     VEG_NAME_FIELD_DEFAULT,
@@ -52,29 +72,98 @@ from .config import (
 )
 from .bores import (
     get_bore_icon_by_key,
+    get_bore_icon_bytes,
     make_bore_icon_key,
     normalize_bore_drill_date,
     normalize_bore_number,
 )
 from .geometry import (
+    ParcelIndex,
     bbox_3857,
+    build_parcel_index,
+    geojson_bounds,
     prepare_clipped_shapes,
     to_shapely_union,
+    total_bounds,
+    total_bounds_of,
 )
 from .kml import (
     PointPlacemark,
     build_kml,
     build_kml_folders,
     build_kml_nested_folders,
-    write_kmz,
+    iter_kmz,
+    iter_zip,
 )
-from .raster import make_geotiff_rgba
+from .raster import geotiff_rgba_bytes
 
 logging.basicConfig(level=logging.INFO)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is installed."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak If-None-Match comparison: any listed tag (``W/`` ignored) or ``*`` matches."""
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == opaque:
+            return True
+    return False
+
+
+def _with_etag(request: Request, response: Response) -> Response:
+    """Tag ``response`` with a body hash and answer a matching If-None-Match with 304.
+
+    The tag is weak because the gzip middleware may send the same payload in another
+    content-coding, which RFC 9110 forbids sharing a strong validator with.
+    """
+    etag = f'W/"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
+
+
+# KMZ/GeoTIFF downloads are already deflate-compressed; gzipping them again only costs CPU.
+_BINARY_DOWNLOAD_PATHS = frozenset({"/export", "/export_kmz", "/export/any"})
+
+
+class _SelectiveGZipMiddleware(GZipMiddleware):
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope.get("path") in _BINARY_DOWNLOAD_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_single_vary(message) -> None:
+            # GZip appends Accept-Encoding to any Vary the endpoint already set (see _with_etag).
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                vary = headers.get("vary")
+                if vary:
+                    headers["vary"] = ", ".join(dict.fromkeys(t.strip() for t in vary.split(",") if t.strip()))
+            await send(message)
+
+        await super().__call__(scope, receive, send_with_single_vary)
+
+
 app = FastAPI(
     title="NSW Native Vegetation (rewritten)",
     description="Unified single/bulk exporter for NSW Native Vegetation + optional overlays (GeoTIFF, KMZ).",
     version="3.0.2",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -84,13 +173,71 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(
+    _SelectiveGZipMiddleware,
+    minimum_size=GZIP_MINIMUM_SIZE,
+    compresslevel=GZIP_COMPRESS_LEVEL,
+)
+
+# Shared pool for overlapping independent ArcGIS round-trips within a request.
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=ARCGIS_FETCH_WORKERS, thread_name_prefix="arcgis")
+
 
+def _fetch_concurrently(calls: Mapping[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """Run zero-argument fetchers on the shared pool and return results by name."""
+
+    futures = {name: _FETCH_EXECUTOR.submit(fn) for name, fn in calls.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+
+@lru_cache(maxsize=4096)
 def _hex(rgb):
     r,g,b = rgb
     return "#{:02x}{:02x}{:02x}".format(int(r),int(g),int(b))
 
+
+def _landtype_legend(clipped: Sequence[tuple]) -> List[Dict[str, Any]]:
+    """One legend row per code from ``(geom, code, name, area_ha)`` tuples, largest area first.
+
+    Areas are totalled with a single numpy group-by; each code keeps its first name.
+    """
+    if not clipped:
+        return []
+    codes = np.empty(len(clipped), dtype=object)
+    codes[:] = [item[1] for item in clipped]
+    areas = np.fromiter((float(item[3]) for item in clipped), dtype=np.float64, count=len(clipped))
+    uniq, first, inverse = np.unique(codes, return_index=True, return_inverse=True)
+    totals = np.bincount(inverse.ravel(), weights=areas, minlength=len(uniq))
+    legend = [
+        {
+            "code": code,
+            "name": clipped[idx][2],
+            "color_hex": _hex(color_from_code(code)),
+            "area_ha": float(total),
+        }
+        for code, idx, total in zip(uniq.tolist(), first.tolist(), totals.tolist())
+    ]
+    legend.sort(key=lambda d: (-d["area_ha"], d["code"]))
+    return legend
+
+
+def _easement_color(code: str, mapping: Mapping[str, str]) -> Tuple[int, int, int]:
+    """KML colour for an easement label, keyed by its identifier when ``mapping`` has one."""
+    return color_from_code(mapping.get(code, code))
+
+
+def _water_color(code: str, layer_id: int) -> Tuple[int, int, int]:
+    """Every shape in a water layer shares the layer's colour."""
+    return color_from_code(f"WATER-{layer_id}")
+
+
+# \w matches the same characters as str.isalnum() plus "_".
+_FILENAME_STRIP_RE = re.compile(r"[^\w\-. ]")
+_SLUG_RE = re.compile(r"\W")
+
+
 def _sanitize_filename(s: Optional[str]) -> str:
-    base = "".join(c for c in (s or "").strip() if c.isalnum() or c in ("_", "-", ".", " "))
+    base = _FILENAME_STRIP_RE.sub("", (s or "").strip())
     return (base or "download").strip()
 
 
@@ -108,15 +255,75 @@ def _clean_text(value: Any) -> str:
     return str(value).strip()
 
 
-def _normalize_bore_properties(raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    props = raw or {}
+@dataclass(frozen=True, slots=True)
+class BoreProps:
+    bore_number: str
+    status: Optional[str] = None
+    status_label: Optional[str] = None
+    type: Optional[str] = None
+    type_label: Optional[str] = None
+    drilled_date: Optional[str] = None
+    report_url: Optional[str] = None
+    icon_key: Optional[str] = None
+
+    def as_dict(self, **extra: Any) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "bore_number": self.bore_number,
+            "status": self.status,
+            "status_label": self.status_label,
+            "type": self.type,
+            "type_label": self.type_label,
+            "drilled_date": self.drilled_date,
+            "report_url": self.report_url,
+            "icon_key": self.icon_key,
+        }
+        out.update(extra)
+        return out
+
+
+@dataclass(frozen=True, slots=True)
+class EasementProps:
+    lotplan: str
+    parcel_type: Optional[str] = None
+    name: Optional[str] = None
+    tenure: Optional[str] = None
+    alias: Optional[str] = None
+    area_m2: Optional[float] = None
+
+    @property
+    def area_ha(self) -> Optional[float]:
+        return None if self.area_m2 is None else self.area_m2 / 10000.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "lotplan": self.lotplan,
+            "parcel_type": self.parcel_type,
+            "name": self.name,
+            "tenure": self.tenure,
+        }
+        if self.alias:
+            out["alias"] = self.alias
+        if self.area_m2 is not None:
+            out["area_m2"] = self.area_m2
+            out["area_ha"] = self.area_ha
+        return out
+
 
-    bore_number = normalize_bore_number(
+def _bore_number_of(raw: Dict[str, Any]) -> str:
+    props = raw or {}
+    return normalize_bore_number(
         props.get("bore_number")
         or props.get(BORE_NUMBER_FIELD)
         or props.get("rn")
         or props.get("rn_char")
     )
+
+
+def _normalize_bore_properties(raw: Dict[str, Any], bore_number: Optional[str] = None) -> Optional[BoreProps]:
+    props = raw or {}
+
+    if bore_number is None:
+        bore_number = _bore_number_of(props)
     if not bore_number:
         return None
 
@@ -160,16 +367,16 @@ def _normalize_bore_properties(raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     def _or_none(value: str) -> Optional[str]:
         return value or None
 
-    return {
-        "bore_number": bore_number,
-        "status": _or_none(status_code),
-        "status_label": _or_none(status_label) or _or_none(status_code),
-        "type": _or_none(bore_type_code),
-        "type_label": _or_none(bore_type_label) or _or_none(bore_type_code),
-        "drilled_date": drilled_date,
-        "report_url": _or_none(report_url),
-        "icon_key": icon_key,
-    }
+    return BoreProps(
+        bore_number=bore_number,
+        status=_or_none(status_code),
+        status_label=_or_none(status_label) or _or_none(status_code),
+        type=_or_none(bore_type_code),
+        type_label=_or_none(bore_type_label) or _or_none(bore_type_code),
+        drilled_date=drilled_date,
+        report_url=_or_none(report_url),
+        icon_key=icon_key,
+    )
 
 
 def _safe_float(value: Any) -> Optional[float]:
@@ -191,24 +398,99 @@ def _safe_float(value: Any) -> Optional[float]:
         return None
 
 
-def _clip_to_parcel_union(geom, parcel_union):
+def _simplify_clipped(data: Sequence[tuple], tolerance: float) -> List[tuple]:
+    """Simplify ``(geom, code, name, area_ha)`` tuples in one vectorized GEOS call."""
+    if not data:
+        return list(data)
+    geoms = np.array([item[0] for item in data], dtype=object)
+    try:
+        simplified = shapely.simplify(geoms, tolerance, preserve_topology=True)
+    except Exception:
+        simplified = geoms
+    keep = ~shapely.is_empty(simplified)
+    out = [
+        (geom, code, name, area_ha)
+        for geom, kept, (_g, code, name, area_ha) in zip(simplified, keep, data)
+        if kept
+    ]
+    return out or list(data)
+
+
+# Coordinates sent to the browser are snapped to 1e-6 degrees (~11 cm).
+_WEB_GRID_SIZE = 1e-6
+
+
+def _simplify_for_web(geoms: Sequence[Any], tolerance: float) -> List[Any]:
+    """Douglas-Peucker simplify and snap ``geoms`` for the map in two vectorized GEOS calls.
+
+    Geometries that would collapse to empty are returned unchanged.
+    """
+    if not geoms or not tolerance or tolerance <= 0:
+        return list(geoms)
+    arr = np.array(geoms, dtype=object)
+    try:
+        out = shapely.set_precision(shapely.simplify(arr, tolerance, preserve_topology=False), _WEB_GRID_SIZE)
+    except Exception:
+        return list(geoms)
+    collapsed = shapely.is_empty(out) | ~shapely.is_valid(out)
+    out[collapsed] = arr[collapsed]
+    return out.tolist()
+
+
+def _geometries_from_features(features: Sequence[Dict[str, Any]]) -> np.ndarray:
+    """Parse every feature's GeoJSON geometry in one ``shapely.from_geojson`` call.
+
+    Missing, malformed and empty geometries come back as ``None``.
+    """
+    texts = np.empty(len(features), dtype=object)
+    for i, feature in enumerate(features):
+        geometry = feature.get("geometry")
+        if geometry:
+            texts[i] = orjson.dumps(geometry) if orjson is not None else json.dumps(geometry)
+    geoms = shapely.from_geojson(texts, on_invalid="ignore")
+    geoms[shapely.is_empty(geoms)] = None
+    return geoms
+
+
+def _geometries_to_geojson(geoms: Sequence[Any]) -> List[Dict[str, Any]]:
+    """GeoJSON mappings for ``geoms`` serialized in one ``shapely.to_geojson`` call."""
+    if len(geoms) == 0:
+        return []
+    texts = shapely.to_geojson(np.asarray(geoms, dtype=object))
+    loads = orjson.loads if orjson is not None else json.loads
+    return [loads(text) for text in texts]
+
+
+def _clip_to_parcel_union(geom, parcel_index: Optional[ParcelIndex]):
     if geom.is_empty:
         return None
-    if parcel_union is None or parcel_union.is_empty:
+    if parcel_index is None:
         return geom
+    if parcel_index.envelope_misses(geom):
+        return None
+    # The prepared union answers both predicates from its cached edge index, so
+    # disjoint and fully-inside easements never reach an overlay.
     try:
-        if not parcel_union.intersects(geom):
+        if not parcel_index.prepared.intersects(geom):
             return None
+        if parcel_index.prepared.contains(geom):
+            return geom
     except Exception:
         pass
     try:
-        clipped = parcel_union.intersection(geom)
+        target = parcel_index.candidates(geom)
+    except Exception:
+        target = parcel_index.union
+    if target is None:
+        return None
+    try:
+        clipped = target.intersection(geom)
     except Exception:
         try:
-            clipped = parcel_union.intersection(make_valid(geom))
+            clipped = target.intersection(make_valid(geom))
         except Exception:
             try:
-                clipped = make_valid(parcel_union).intersection(make_valid(geom))
+                clipped = make_valid(target).intersection(make_valid(geom))
             except Exception:
                 clipped = geom
     if clipped.is_empty:
@@ -216,7 +498,37 @@ def _clip_to_parcel_union(geom, parcel_union):
     return clipped
 
 
-def _normalize_easement_properties(raw: Dict[str, Any], lotplan: str) -> Dict[str, Any]:
+def _clip_array_to_parcel(geoms: np.ndarray, parcel_index: Optional[ParcelIndex]) -> np.ndarray:
+    """Vectorized ``_clip_to_parcel_union`` over an object array (``None`` marks dropped entries).
+
+    Disjoint and fully-contained geometries are settled by two predicate calls against the
+    prepared union; only boundary-crossing ones are intersected, in a single overlay call.
+    """
+    out = np.empty(len(geoms), dtype=object)
+    present = ~shapely.is_missing(geoms)
+    if parcel_index is None or not present.any():
+        out[present] = geoms[present]
+        return out
+    union = parcel_index.union
+    try:
+        shapely.prepare(union)
+        hits = present.copy()
+        hits[present] = shapely.intersects(union, geoms[present])
+        inside = hits.copy()
+        inside[hits] = shapely.contains(union, geoms[hits])
+        out[inside] = geoms[inside]
+        crossing = hits & ~inside
+        out[crossing] = shapely.intersection(geoms[crossing], union)
+    except Exception:
+        # Invalid input somewhere in the batch; fall back to the per-geometry repair path.
+        out = np.empty(len(geoms), dtype=object)
+        out[:] = [None if geom is None else _clip_to_parcel_union(geom, parcel_index) for geom in geoms]
+    present = ~shapely.is_missing(out)
+    out[present & shapely.is_empty(out)] = None
+    return out
+
+
+def _normalize_easement_properties(raw: Dict[str, Any], lotplan: str) -> EasementProps:
     props = raw or {}
 
     owner_lp_raw = normalize_lotplan(
@@ -251,21 +563,14 @@ def _normalize_easement_properties(raw: Dict[str, Any], lotplan: str) -> Dict[st
         area_value = props.get(EASEMENT_AREA_FIELD)
     area_m2 = _safe_float(area_value)
 
-    out: Dict[str, Any] = {
-        "lotplan": owner_lp or fallback_lp,
-        "parcel_type": parcel_type or None,
-        "name": name or alias or None,
-        "tenure": tenure or None,
-    }
-
-    if alias:
-        out["alias"] = alias
-
-    if area_m2 is not None:
-        out["area_m2"] = area_m2
-        out["area_ha"] = area_m2 / 10000.0
-
-    return out
+    return EasementProps(
+        lotplan=owner_lp or fallback_lp,
+        parcel_type=parcel_type or None,
+        name=name or alias or None,
+        tenure=tenure or None,
+        alias=alias or None,
+        area_m2=area_m2,
+    )
 
 
 def _require_parcel_features(parcel_fc: Dict[str, Any], lotplan: str) -> Dict[str, Any]:
@@ -290,7 +595,11 @@ def _bounds_dict_from_geom(bounds_geom, fallback=None) -> Dict[str, Optional[flo
         candidate = fallback
     if candidate is None or getattr(candidate, "is_empty", True):
         return {"west": None, "south": None, "east": None, "north": None}
-    west, south, east, north = candidate.bounds
+    return _bounds_dict(candidate.bounds)
+
+
+def _bounds_dict(bounds: Sequence[float]) -> Dict[str, Optional[float]]:
+    west, south, east, north = bounds
     return {
         "west": _clean_bound_value(west),
         "south": _clean_bound_value(south),
@@ -313,8 +622,8 @@ for _mime, _ext in _ICON_EXTENSIONS.items():
 
 
 def _slugify_icon_key(icon_key: str) -> str:
-    key = (icon_key or "").strip().lower().replace(",", "_")
-    return "".join(ch if ch.isalnum() or ch == "_" else "_" for ch in key) or "icon"
+    key = (icon_key or "").strip().lower()
+    return _SLUG_RE.sub("_", key) or "icon"
 
 
 def _icon_href_for_key(icon_key: str, content_type: Optional[str]) -> str:
@@ -342,33 +651,26 @@ def _data_uri_for_icon(icon_href: str, data: Optional[bytes]) -> Optional[str]:
     return f"data:{content_type};base64,{encoded}"
 
 
-def _inline_point_icon_hrefs(
-    points: Sequence[PointPlacemark], assets: Mapping[str, bytes]
-) -> List[PointPlacemark]:
-    if not points:
-        return []
-    if not assets:
-        return list(points)
-
-    cache: Dict[str, Optional[str]] = {}
-    updated: List[PointPlacemark] = []
-    for point in points:
-        icon_href = point.icon_href
-        if not icon_href:
-            updated.append(point)
+def _inline_point_icon_hrefs(points: List[PointPlacemark], assets: Mapping[str, bytes]) -> None:
+    """Swap icon hrefs for ``data:`` URIs in place, for plain-KML output without a KMZ.
+
+    KML styles are emitted once per ``style_id`` from the first placemark carrying it,
+    so only those placemarks are replaced; the rest of the list is left untouched.
+    """
+    if not points or not assets:
+        return
+
+    inlined: Set[str] = set()
+    for i, point in enumerate(points):
+        if not point.style_id or not point.icon_href or point.style_id in inlined:
             continue
-        if icon_href not in cache:
-            raw_data = assets.get(icon_href)
-            cache[icon_href] = _data_uri_for_icon(icon_href, raw_data)
-        data_uri = cache[icon_href]
+        inlined.add(point.style_id)
+        data_uri = _data_uri_for_icon(point.icon_href, assets.get(point.icon_href))
         if data_uri:
-            updated.append(replace(point, icon_href=data_uri))
-        else:
-            updated.append(point)
-    return updated
+            points[i] = replace(point, icon_href=data_uri)
 
 
-def _format_bore_description(props: Dict[str, Any]) -> str:
+def _format_bore_description(props: BoreProps) -> str:
     def combine(label: Optional[str], code: Optional[str]) -> Optional[str]:
         label_clean = (label or "").strip()
         code_clean = (code or "").strip()
@@ -376,23 +678,36 @@ def _format_bore_description(props: Dict[str, Any]) -> str:
             return f"{label_clean} ({code_clean})"
         return label_clean or code_clean or None
 
+    _e = html.escape
     parts: List[str] = []
-    status_text = combine(props.get("status_label"), props.get("status"))
+    status_text = combine(props.status_label, props.status)
     if status_text:
-        parts.append(f"<b>Status:</b> {html.escape(status_text)}")
-    type_text = combine(props.get("type_label"), props.get("type"))
+        parts.append(f"<b>Status:</b> {_e(status_text)}")
+    type_text = combine(props.type_label, props.type)
     if type_text:
-        parts.append(f"<b>Type:</b> {html.escape(type_text)}")
-    drilled = props.get("drilled_date")
+        parts.append(f"<b>Type:</b> {_e(type_text)}")
+    drilled = props.drilled_date
     if drilled:
-        parts.append(f"<b>Drilled:</b> {html.escape(str(drilled))}")
-    report_url = props.get("report_url")
+        parts.append(f"<b>Drilled:</b> {_e(str(drilled))}")
+    report_url = props.report_url
     if report_url:
-        safe_url = html.escape(str(report_url), quote=True)
-        parts.append(f'<a href="{safe_url}" target="_blank" rel="noopener">View bore report</a>')
+        parts.append(
+            f'<a href="{_e(str(report_url), quote=True)}" target="_blank" rel="noopener">View bore report</a>'
+        )
     return "<br/>".join(parts)
 
 
+@lru_cache(maxsize=256)
+def _bore_icon_asset(icon_key: str) -> Optional[Tuple[bytes, str, str]]:
+    """Return ``(bytes, href, style_id)`` for an embeddable bore icon."""
+    icon_bytes = get_bore_icon_bytes(icon_key)
+    if not icon_bytes:
+        return None
+    icon_def = get_bore_icon_by_key(icon_key)
+    icon_href = _icon_href_for_key(icon_key, icon_def.content_type if icon_def else None)
+    return icon_bytes, icon_href, f"bore_{_slugify_icon_key(icon_key)}"
+
+
 def _prepare_bore_placemarks(
     parcel_geom,
     bore_fc: Dict[str, Any],
@@ -401,50 +716,55 @@ def _prepare_bore_placemarks(
     assets: Dict[str, bytes] = {}
     seen_numbers: Set[str] = set()
 
+    candidates: List[Tuple[Dict[str, Any], float, float]] = []
     for bore in bore_fc.get("features", []):
-        try:
-            geom = shp_shape(bore.get("geometry"))
-        except Exception:
+        geometry = bore.get("geometry") or {}
+        if geometry.get("type") != "Point":
             continue
-        if geom.is_empty or geom.geom_type != "Point":
+        coords = geometry.get("coordinates") or ()
+        try:
+            lon, lat = float(coords[0]), float(coords[1])
+        except (TypeError, ValueError, IndexError):
             continue
-        if parcel_geom is not None:
-            try:
-                if not geom.intersects(parcel_geom):
-                    continue
-            except Exception:
-                pass
-        props = _normalize_bore_properties(bore.get("properties") or {})
-        if not props:
+        if not (math.isfinite(lon) and math.isfinite(lat)):
             continue
-        bore_number = props.get("bore_number")
+        candidates.append((bore, lon, lat))
+
+    if candidates and parcel_geom is not None:
+        xs = np.fromiter((c[1] for c in candidates), dtype=np.float64, count=len(candidates))
+        ys = np.fromiter((c[2] for c in candidates), dtype=np.float64, count=len(candidates))
+        try:
+            shapely.prepare(parcel_geom)
+            mask = shapely.intersects_xy(parcel_geom, xs, ys)
+        except Exception:
+            mask = None
+        if mask is not None:
+            candidates = [c for c, keep in zip(candidates, mask) if keep]
+
+    for bore, lon, lat in candidates:
+        raw_props = bore.get("properties") or {}
+        bore_number = _bore_number_of(raw_props)
         if not bore_number or bore_number in seen_numbers:
             continue
+        props = _normalize_bore_properties(raw_props, bore_number)
+        if not props:
+            continue
         seen_numbers.add(bore_number)
 
-        icon_key = props.get("icon_key")
         style_id = None
         icon_href = None
-        if icon_key:
-            icon_def = get_bore_icon_by_key(icon_key)
-            image_data = icon_def.image_data if icon_def else None
-            if image_data:
-                try:
-                    icon_bytes = base64.b64decode(image_data)
-                except (binascii.Error, ValueError):
-                    icon_bytes = None
-                if icon_bytes:
-                    icon_href = _icon_href_for_key(icon_key, icon_def.content_type if icon_def else None)
-                    assets.setdefault(icon_href, icon_bytes)
-                    style_id = f"bore_{_slugify_icon_key(icon_key)}"
+        icon_asset = _bore_icon_asset(props.icon_key) if props.icon_key else None
+        if icon_asset is not None:
+            icon_bytes, icon_href, style_id = icon_asset
+            assets.setdefault(icon_href, icon_bytes)
 
         description_html = _format_bore_description(props)
         placemarks.append(
             PointPlacemark(
                 name=bore_number,
                 description_html=description_html,
-                lon=float(geom.x),
-                lat=float(geom.y),
+                lon=lon,
+                lat=lat,
                 style_id=style_id,
                 icon_href=icon_href,
             )
@@ -471,17 +791,8 @@ def _format_water_value(key: str, value: Any) -> str:
     return text
 
 
-def _format_water_description(props: Dict[str, Any]) -> str:
-    name = props.get("display_name") or props.get("name") or props.get("layer_title") or "Water feature"
-    lines: List[str] = [f"<b>{html.escape(str(name))}</b>"]
-    layer_title = props.get("layer_title")
-    if layer_title:
-        lines.append(f"<span class=\"muted\">Layer:</span> {html.escape(str(layer_title))}")
-    lotplan = props.get("lotplan")
-    if lotplan:
-        lines.append(f"<span class=\"muted\">Lot/Plan:</span> {html.escape(str(lotplan))}")
-
-    skip_keys = {
+_WATER_SKIP_KEYS = frozenset(
+    {
         "display_name",
         "name",
         "code",
@@ -491,34 +802,92 @@ def _format_water_description(props: Dict[str, Any]) -> str:
         "lotplan",
         "icon_key",
     }
+)
 
-    extra: List[Tuple[str, str]] = []
-    for key, raw_value in (props or {}).items():
-        if key in skip_keys:
+
+@lru_cache(maxsize=1024)
+def _water_label(key: str) -> Tuple[str, str]:
+    """Return the display label for a water attribute key and its escaped form."""
+    label = key.replace("_", " ").strip().title()
+    return label, html.escape(label)
+
+
+_MIN_EPOCH_S = -62135596800.0  # 0001-01-01T00:00:00Z, datetime's lower bound
+_MAX_EPOCH_S = 253402300799.0  # 9999-12-31T23:59:59Z, datetime's upper bound
+
+
+def _epoch_dates_iso(values: Sequence[float]) -> List[Optional[str]]:
+    """Vectorized form of the epoch branch of _format_water_value (None where it would fail)."""
+    arr = np.asarray(values, dtype=np.float64)
+    arr = np.where(arr > 10_000_000_000, arr / 1000.0, arr)
+    ok = np.isfinite(arr) & (arr >= _MIN_EPOCH_S) & (arr <= _MAX_EPOCH_S)
+    secs = np.floor(np.where(ok, arr, 0.0)).astype(np.int64)
+    days = secs.astype("datetime64[s]").astype("datetime64[D]").astype(str)
+    return [day if good else None for day, good in zip(days.tolist(), ok.tolist())]
+
+
+def _water_layer_dates(props_list: Sequence[Dict[str, Any]]) -> Dict[int, Dict[str, str]]:
+    """Pre-format numeric date columns for a whole layer, keyed by ``id(props)``."""
+    date_keys = {
+        key
+        for props in props_list
+        for key in props
+        if "date" in str(key).lower() and key not in _WATER_SKIP_KEYS
+    }
+    out: Dict[int, Dict[str, str]] = {}
+    for key in date_keys:
+        owners: List[Dict[str, Any]] = []
+        values: List[float] = []
+        for props in props_list:
+            value = props.get(key)
+            if isinstance(value, (int, float)):
+                owners.append(props)
+                values.append(float(value))
+        if not values:
             continue
-        if raw_value is None:
+        for props, iso in zip(owners, _epoch_dates_iso(values)):
+            if iso is not None:
+                out.setdefault(id(props), {})[key] = iso
+    return out
+
+
+def _format_water_description(
+    props: Dict[str, Any],
+    dates: Optional[Mapping[str, str]] = None,
+) -> str:
+    _e = html.escape
+    name = props.get("display_name") or props.get("name") or props.get("layer_title") or "Water feature"
+    lines: List[str] = [f"<b>{_e(str(name))}</b>"]
+    layer_title = props.get("layer_title")
+    if layer_title:
+        lines.append(f"<span class=\"muted\">Layer:</span> {_e(str(layer_title))}")
+    lotplan = props.get("lotplan")
+    if lotplan:
+        lines.append(f"<span class=\"muted\">Lot/Plan:</span> {_e(str(lotplan))}")
+
+    extra: List[Tuple[Tuple[str, str], str]] = []
+    for key, raw_value in (props or {}).items():
+        if raw_value is None or key in _WATER_SKIP_KEYS:
             continue
         if isinstance(raw_value, (list, tuple)):
-            values = [_clean_text(v) for v in raw_value if _clean_text(v)]
+            values = [text for text in map(_clean_text, raw_value) if text]
             if not values:
                 continue
             value_text = ", ".join(values)
         else:
-            value_text = _format_water_value(key, raw_value)
-            value_text = _clean_text(value_text)
+            formatted = dates.get(key) if dates else None
+            value_text = formatted or _clean_text(_format_water_value(key, raw_value))
             if not value_text:
                 continue
-        label = key.replace("_", " ").strip().title()
-        extra.append((label, value_text))
+        extra.append((_water_label(key), value_text))
 
-    extra.sort()
-    for label, value_text in extra[:8]:
-        lines.append(f"<span class=\"muted\">{html.escape(label)}:</span> {html.escape(value_text)}")
+    for (_label, label_html), value_text in heapq.nsmallest(8, extra):
+        lines.append(f"<span class=\"muted\">{label_html}:</span> {_e(value_text)}")
 
     return "<br/>".join(lines)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WaterLayerKMZ:
     layer_id: int
     layer_title: str
@@ -529,15 +898,71 @@ class WaterLayerKMZ:
     feature_collection: Dict[str, Any]
 
 
+def _geojson_point_coords(geometry: Dict[str, Any]) -> List[Tuple[float, float]]:
+    raw = geometry.get("coordinates") or []
+    if geometry.get("type") == "Point":
+        raw = [raw]
+    coords: List[Tuple[float, float]] = []
+    for item in raw:
+        try:
+            lon, lat = float(item[0]), float(item[1])
+        except (TypeError, ValueError, IndexError):
+            continue
+        if math.isfinite(lon) and math.isfinite(lat):
+            coords.append((lon, lat))
+    return coords
+
+
+def _filter_points_to_parcel(
+    parcel_geom,
+    rows: Sequence[Tuple[Dict[str, Any], str, List[Tuple[float, float]]]],
+) -> List[Tuple[Dict[str, Any], str, List[Tuple[float, float]]]]:
+    """Keep the coordinates of each row that fall on the parcel, in one vectorized test."""
+    flat = [coord for _props, _code, coords in rows for coord in coords]
+    if not flat:
+        return []
+    if parcel_geom is None or parcel_geom.is_empty:
+        return []
+    xy = np.asarray(flat, dtype=np.float64)
+    shapely.prepare(parcel_geom)
+    mask = shapely.intersects_xy(parcel_geom, xy[:, 0], xy[:, 1])
+
+    out: List[Tuple[Dict[str, Any], str, List[Tuple[float, float]]]] = []
+    pos = 0
+    for props, code, coords in rows:
+        kept = [coord for coord, hit in zip(coords, mask[pos:pos + len(coords)]) if hit]
+        pos += len(coords)
+        if kept:
+            out.append((props, code, kept))
+    return out
+
+
+def _dissolve_points(
+    rows: Sequence[Tuple[Dict[str, Any], str, List[Tuple[float, float]]]],
+) -> List[tuple]:
+    """Group kept point rows by code and name into the tuples prepare_clipped_shapes yields."""
+    grouped: Dict[Tuple[str, str], List[Any]] = {}
+    for props, code, kept in rows:
+        name = str(props.get("name") or code)
+        part = shapely.points(kept[0]) if len(kept) == 1 else shapely.multipoints(kept)
+        grouped.setdefault((code, name), []).append(part)
+    return [
+        (parts[0] if len(parts) == 1 else shapely.union_all(parts), code, name, 0.0)
+        for (code, name), parts in grouped.items()
+    ]
+
+
 def _prepare_water_layers(
     parcel_fc: Dict[str, Any],
     water_layers_raw: Sequence[Dict[str, Any]],
     lotplan: Optional[str],
+    simplify_tolerance: float = 0.0,
 ) -> List[WaterLayerKMZ]:
     if not water_layers_raw:
         return []
 
     prepared: List[WaterLayerKMZ] = []
+    parcel_union = None
 
     for layer in water_layers_raw:
         layer_id = int(layer.get("layer_id", -1))
@@ -551,6 +976,7 @@ def _prepare_water_layers(
         props_lookup: Dict[str, Dict[str, Any]] = {}
         features_for_clip: List[Dict[str, Any]] = []
         fc_for_clip = {"type": "FeatureCollection", "features": features_for_clip}
+        point_rows: List[Tuple[Dict[str, Any], str, List[Tuple[float, float]]]] = []
         for feature in features:
             geometry = feature.get("geometry")
             if not geometry:
@@ -568,6 +994,10 @@ def _prepare_water_layers(
             if lotplan:
                 props.setdefault("lotplan", lotplan)
             props_lookup[code] = props
+            if geometry.get("type") in ("Point", "MultiPoint"):
+                # Points only need their raw coordinates; skip building shapely geometries.
+                point_rows.append((props, code, _geojson_point_coords(geometry)))
+                continue
             features_for_clip.append(
                 {"type": "Feature", "geometry": geometry, "properties": props}
             )
@@ -575,23 +1005,31 @@ def _prepare_water_layers(
         if not props_lookup:
             continue
 
-        clipped = prepare_clipped_shapes(parcel_fc, fc_for_clip)
-        if not clipped:
-            continue
+        layer_dates = _water_layer_dates(list(props_lookup.values()))
 
         shapes: List[tuple] = []
         points: List[PointPlacemark] = []
         clipped_features: List[Dict[str, Any]] = []
 
-        for geom4326, code, name, area_ha in clipped:
-            props = dict(props_lookup.get(code, {}))
-            props.setdefault("name", name)
-            if lotplan:
-                props.setdefault("lotplan", lotplan)
-            try:
-                geom_mapping = shp_mapping(geom4326)
-            except Exception:
-                continue
+        clipped = prepare_clipped_shapes(parcel_fc, fc_for_clip) if features_for_clip else []
+        if clipped and simplify_tolerance > 0:
+            simplified = _simplify_for_web([item[0] for item in clipped], simplify_tolerance)
+            clipped = [(geom, *item[1:]) for geom, item in zip(simplified, clipped)]
+        if point_rows:
+            if parcel_union is None:
+                parcel_union = to_shapely_union(parcel_fc)
+            clipped.extend(_dissolve_points(_filter_points_to_parcel(parcel_union, point_rows)))
+        if not clipped:
+            continue
+
+        geom_mappings = _geometries_to_geojson([item[0] for item in clipped])
+        for (geom4326, code, name, area_ha), geom_mapping in zip(clipped, geom_mappings):
+            # props_lookup entries already carry name/lotplan, so share them rather than copying.
+            props = props_lookup.get(code)
+            if props is None:
+                props = {"name": name}
+                if lotplan:
+                    props["lotplan"] = lotplan
             clipped_features.append(
                 {
                     "type": "Feature",
@@ -602,7 +1040,7 @@ def _prepare_water_layers(
 
             geom_type = getattr(geom4326, "geom_type", "")
             if geom_type == "Point":
-                description_html = _format_water_description(props)
+                description_html = _format_water_description(props, layer_dates.get(id(props)))
                 points.append(
                     PointPlacemark(
                         name=props.get("display_name") or props.get("name") or code,
@@ -612,7 +1050,7 @@ def _prepare_water_layers(
                     )
                 )
             elif geom_type == "MultiPoint":
-                description_html = _format_water_description(props)
+                description_html = _format_water_description(props, layer_dates.get(id(props)))
                 for part in getattr(geom4326, "geoms", []):
                     if part is None or getattr(part, "is_empty", False):
                         continue
@@ -645,6 +1083,22 @@ def _prepare_water_layers(
     return prepared
 
 
+def _water_layers_bounds(layers: Sequence[WaterLayerKMZ]) -> Optional[Tuple[float, float, float, float]]:
+    """Extent of prepared water layers from their clipped shapes and point placemarks.
+
+    Every emitted water feature is backed by one of these, so no GeoJSON is re-parsed.
+    """
+    rows = []
+    shapes_box = total_bounds(shape[0] for layer in layers for shape in layer.shapes)
+    if shapes_box is not None:
+        rows.append(shapes_box)
+    coords = np.array([(point.lon, point.lat) for layer in layers for point in layer.points], dtype=np.float64)
+    if coords.size:
+        (west, south), (east, north) = coords.min(axis=0), coords.max(axis=0)
+        rows.append((float(west), float(south), float(east), float(north)))
+    return total_bounds_of(rows) if rows else None
+
+
 def _render_parcel_kml(
     lotplan: str,
     lt_clipped,
@@ -658,7 +1112,7 @@ def _render_parcel_kml(
             (veg_clipped, color_from_code, f"Vegetation – {lotplan}"),
         ]
         if bore_points:
-            groups.append(([], color_from_code, BORE_FOLDER_NAME, list(bore_points)))
+            groups.append(([], color_from_code, BORE_FOLDER_NAME, bore_points))
         return build_kml_folders(groups, doc_name=f"QLD Export – {lotplan}")
 
     if bore_points:
@@ -666,29 +1120,21 @@ def _render_parcel_kml(
             lt_clipped,
             color_fn=color_from_code,
             folder_name=folder_name,
-            point_placemarks=list(bore_points),
+            point_placemarks=bore_points,
             point_folder_name=BORE_FOLDER_NAME,
         )
     return build_kml(lt_clipped, color_fn=color_from_code, folder_name=folder_name)
 
 
 def _kmz_bytes(kml_text: str, assets: Dict[str, bytes]) -> bytes:
-    mem = BytesIO()
-    with zipfile.ZipFile(mem, "w", compression=zipfile.ZIP_DEFLATED) as ztmp:
-        ztmp.writestr("doc.kml", kml_text.encode("utf-8"))
-        for name, data in (assets or {}).items():
-            if not name or data is None:
-                continue
-            ztmp.writestr(name, data)
-    return mem.getvalue()
+    return b"".join(iter_kmz(kml_text, assets))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PropertyReportKMZ:
     lotplan: str
     filename: str
     kml_text: str
-    kmz_bytes: bytes
     landtypes: Tuple[tuple, ...]
     vegetation: Tuple[tuple, ...]
     easements: Tuple[tuple, ...]
@@ -697,6 +1143,31 @@ class PropertyReportKMZ:
     bore_points: Tuple[PointPlacemark, ...]
     bore_assets: Mapping[str, bytes]
 
+    def iter_kmz(self) -> Iterator[bytes]:
+        # Deflated as it is served, so cached reports never hold a finished archive.
+        return iter_kmz(self.kml_text, self.bore_assets)
+
+
+_PIPE_TRANS = str.maketrans({"|": "/"})
+
+
+def _standardise_veg_features(
+    veg_fc: Dict[str, Any],
+    code_field: Optional[str],
+    name_field: Optional[str],
+) -> None:
+    """Set ``code`` and a "Category *" ``name`` on each vegetation feature in place."""
+    code_key = code_field or "code"
+    name_key = name_field or "name"
+    for feature in veg_fc.get("features", []):
+        props = feature.get("properties")
+        if not props:
+            continue
+        code = str(props.get(code_key) or props.get("code") or "").strip()
+        name = str(props.get(name_key) or props.get("name") or code).strip()
+        props["code"] = code or name or "UNK"
+        props["name"] = f"Category {name or code or 'Unknown'}"
+
 
 def _default_veg_config() -> Tuple[str, Optional[int], str, Optional[str]]:
     veg_url = (VEG_SERVICE_URL_DEFAULT or "").strip()
@@ -724,40 +1195,46 @@ def build_property_report_kmz(
     parcel_union = to_shapely_union(parcel_fc)
     env = bbox_3857(parcel_union)
 
-    thematic_fc = fetch_landtypes_intersecting_envelope(env)
-    lt_clipped = prepare_clipped_shapes(parcel_fc, thematic_fc)
-
-    bore_fc = fetch_bores_intersecting_envelope(env)
-    bore_points, bore_assets = _prepare_bore_placemarks(parcel_union, bore_fc)
-
-    water_layers_raw = fetch_water_layers_intersecting_envelope(env)
-    water_layers = _prepare_water_layers(parcel_fc, water_layers_raw, lotplan_norm)
-
     veg_url = (veg_service_url or "").strip()
     veg_layer = veg_layer_id
     veg_name = (veg_name_field or "").strip()
     veg_code = (veg_code_field or "").strip() or None
     if not veg_url or veg_layer is None or not veg_name:
         veg_url, veg_layer, veg_name, veg_code = _default_veg_config()
-
-    veg_clipped: List[tuple] = []
-    if veg_url and veg_layer is not None and veg_name:
-        veg_fc = fetch_features_intersecting_envelope(
+    want_veg = bool(veg_url and veg_layer is not None and veg_name)
+
+    # The layer queries only depend on the envelope, so issue them together.
+    fetches: Dict[str, Callable[[], Any]] = {
+        "landtypes": lambda: fetch_landtypes_intersecting_envelope(env),
+        "bores": lambda: fetch_bores_intersecting_envelope(env),
+        "water": lambda: fetch_water_layers_intersecting_envelope(env),
+        "easements": lambda: fetch_easements_intersecting_envelope(env),
+    }
+    if want_veg:
+        fetches["vegetation"] = lambda: fetch_features_intersecting_envelope(
             veg_url,
             veg_layer,
             env,
             out_fields="*",
         )
-        for feature in veg_fc.get("features", []):
-            props = feature.get("properties") or {}
-            code = str(props.get(veg_code or "code") or props.get("code") or "").strip()
-            name = str(props.get(veg_name or "name") or props.get("name") or code).strip()
-            props["code"] = code or name or "UNK"
-            category_name = name or code or "Unknown"
-            props["name"] = f"Category {category_name}"
+    fetched = _fetch_concurrently(fetches)
+
+    thematic_fc = fetched["landtypes"]
+    lt_clipped = prepare_clipped_shapes(parcel_fc, thematic_fc)
+
+    bore_fc = fetched["bores"]
+    bore_points, bore_assets = _prepare_bore_placemarks(parcel_union, bore_fc)
+
+    water_layers_raw = fetched["water"]
+    water_layers = _prepare_water_layers(parcel_fc, water_layers_raw, lotplan_norm)
+
+    veg_clipped: List[tuple] = []
+    if want_veg:
+        veg_fc = fetched["vegetation"]
+        _standardise_veg_features(veg_fc, veg_code, veg_name)
         veg_clipped = prepare_clipped_shapes(parcel_fc, veg_fc)
 
-    easement_fc = fetch_easements_intersecting_envelope(env)
+    easement_fc = fetched["easements"]
     easement_features: List[Dict[str, Any]] = []
     easement_meta: Dict[str, Dict[str, Any]] = {}
     for feature in (easement_fc or {}).get("features", []):
@@ -765,14 +1242,16 @@ def build_property_report_kmz(
         if not geometry:
             continue
         props = _normalize_easement_properties(feature.get("properties") or {}, lotplan_norm)
-        owner_lp = props.get("lotplan") or lotplan_norm
-        parcel_type = props.get("parcel_type") or ""
-        tenure = props.get("tenure") or ""
-        alias = props.get("alias") or ""
-        display_name = props.get("name") or alias or "Easement"
-        identifier_parts = [owner_lp or "", parcel_type, tenure, alias, display_name]
-        sanitized_parts = [(part or "").replace("|", "/") for part in identifier_parts]
-        identifier = "|".join(sanitized_parts).strip("|") or (owner_lp or lotplan_norm or "Easement")
+        owner_lp = props.lotplan or lotplan_norm
+        parcel_type = props.parcel_type or ""
+        tenure = props.tenure or ""
+        alias = props.alias or ""
+        display_name = props.name or alias or "Easement"
+        identifier = (
+            f"{(owner_lp or '').translate(_PIPE_TRANS)}|{parcel_type.translate(_PIPE_TRANS)}"
+            f"|{tenure.translate(_PIPE_TRANS)}|{alias.translate(_PIPE_TRANS)}"
+            f"|{display_name.translate(_PIPE_TRANS)}"
+        ).strip("|") or (owner_lp or lotplan_norm or "Easement")
         color_key = parcel_type or tenure or owner_lp or "Easement"
         easement_meta[identifier] = {
             "lotplan": owner_lp,
@@ -781,7 +1260,7 @@ def build_property_report_kmz(
             "alias": alias,
             "display_name": display_name,
             "color_key": color_key,
-            "area_ha": props.get("area_ha"),
+            "area_ha": props.area_ha,
         }
         easement_features.append(
             {
@@ -800,23 +1279,11 @@ def build_property_report_kmz(
     )
 
     if simplify_tolerance and simplify_tolerance > 0:
-        def _simplify(data: Iterable[tuple]) -> Tuple[tuple, ...]:
-            simplified: List[tuple] = []
-            for geom4326, code, name, area_ha in data:
-                try:
-                    g2 = geom4326.simplify(simplify_tolerance, preserve_topology=True)
-                except Exception:
-                    g2 = geom4326
-                if g2.is_empty:
-                    continue
-                simplified.append((g2, code, name, area_ha))
-            return tuple(simplified) if simplified else tuple(data)
-
-        lt_clipped = list(_simplify(lt_clipped))
+        lt_clipped = _simplify_clipped(lt_clipped, simplify_tolerance)
         if veg_clipped:
-            veg_clipped = list(_simplify(veg_clipped))
+            veg_clipped = _simplify_clipped(veg_clipped, simplify_tolerance)
         if easement_clipped_raw:
-            easement_clipped_raw = list(_simplify(easement_clipped_raw))
+            easement_clipped_raw = _simplify_clipped(easement_clipped_raw, simplify_tolerance)
 
     easement_clipped: List[tuple] = []
     easement_color_lookup: Dict[str, str] = {}
@@ -857,27 +1324,25 @@ def build_property_report_kmz(
         area_for_tuple = area_ha if area_ha is not None else area_value
         easement_clipped.append((geom4326, code_text, display_label, area_for_tuple))
 
-    def _easement_color_fn(code: str) -> Tuple[int, int, int]:
-        base = easement_color_lookup.get(code, code)
-        return color_from_code(base)
-
     top_level_groups: List[Tuple[str, List[tuple]]] = []
     if lt_clipped:
         top_level_groups.append(("Land Types", [(lt_clipped, color_from_code, None)]))
     if veg_clipped:
         top_level_groups.append(("Vegetation", [(veg_clipped, color_from_code, None)]))
     if easement_clipped:
-        top_level_groups.append(("Easements", [(easement_clipped, _easement_color_fn, None)]))
+        top_level_groups.append(("Easements", [(easement_clipped, partial(_easement_color, mapping=easement_color_lookup), None)]))
 
     water_children: List[tuple] = []
     if bore_points:
-        water_children.append(([], color_from_code, BORE_FOLDER_NAME, list(bore_points)))
+        water_children.append(([], color_from_code, BORE_FOLDER_NAME, bore_points))
     for layer in water_layers:
-        def _water_color_fn(code: str, _layer_id=layer.layer_id) -> Tuple[int, int, int]:
-            return color_from_code(f"WATER-{_layer_id}")
-
         water_children.append(
-            (list(layer.shapes), _water_color_fn, layer.layer_title, list(layer.points))
+            (
+                layer.shapes,
+                partial(_water_color, layer_id=layer.layer_id),
+                layer.layer_title,
+                layer.points,
+            )
         )
 
     if water_children:
@@ -895,36 +1360,19 @@ def build_property_report_kmz(
     if not (lt_clipped or veg_clipped or easement_clipped or bore_points or has_water):
         raise HTTPException(status_code=404, detail="No features intersect this parcel.")
 
-    tmpdir = tempfile.mkdtemp(prefix="kmz_")
     filename = f"Property Report – {safe_lotplan}.kmz"
-    out_path = os.path.join(tmpdir, filename)
-    try:
-        write_kmz(kml_text, out_path, assets=bore_assets)
-        with open(out_path, "rb") as fh:
-            kmz_bytes = fh.read()
-    finally:
-        try:
-            if os.path.exists(out_path):
-                os.remove(out_path)
-        except Exception:
-            pass
-        try:
-            os.rmdir(tmpdir)
-        except Exception:
-            pass
 
     return PropertyReportKMZ(
         lotplan=lotplan_norm,
         filename=filename,
         kml_text=kml_text,
-        kmz_bytes=kmz_bytes,
         landtypes=tuple(lt_clipped or []),
         vegetation=tuple(veg_clipped or []),
         easements=tuple(easement_clipped or []),
-        easement_color_map=dict(easement_color_lookup),
+        easement_color_map=MappingProxyType(easement_color_lookup),
         water_layers=tuple(water_layers),
         bore_points=tuple(bore_points),
-        bore_assets=dict(bore_assets),
+        bore_assets=MappingProxyType(bore_assets),
     )
 
 @app.head("/")
@@ -933,7 +1381,7 @@ def home_head(): return Response(status_code=200)
 @app.get("/", response_class=HTMLResponse)
 def home():
     # Replace configuration placeholders with actual values
-    html_template = """<!doctype html>
+    html_template = r"""<!doctype html>
 <html><head>
 <meta charset="utf-8"/><meta name="viewport" content="width=device-width, initial-scale=1"/>
 <title>QLD Land Types (rewritten)</title>
@@ -952,6 +1400,7 @@ button.primary{background:var(--accent);color:#071021}a.ghost{color:var(--accent
 .badge{display:inline-block;padding:.2rem .5rem;border-radius:999px;background:#11204a;color:#9fc1ff;font-size:12px;margin-left:8px}
 .chip{display:inline-flex;align-items:center;gap:6px;padding:.2rem .6rem;border-radius:999px;background:#11204a;color:#9fc1ff;font-size:12px}
 .muted{color:#9fb2d8}.box{border:1px solid #203055;border-radius:12px;padding:10px;background:#0e1526;margin-top:6px}
+.leaflet-tooltip.cluster-count{background:transparent;border:0;box-shadow:none;color:#071021;font-weight:700;padding:0}.leaflet-tooltip.cluster-count:before{display:none}
 </style>
 </head>
 <body>
@@ -987,6 +1436,8 @@ button.primary{background:var(--accent);color:#071021}a.ghost{color:var(--accent
 </div></div>
 
 <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js" crossorigin="" defer></script>
+<script src="https://unpkg.com/supercluster@8.0.1/dist/supercluster.min.js" crossorigin="" defer></script>
+<script src="https://unpkg.com/leaflet.vectorgrid@1.3.0/dist/Leaflet.VectorGrid.bundled.js" crossorigin="" defer></script>
 <script>
 const $items = document.getElementById('items'),
       $name = document.getElementById('name'),
@@ -1046,8 +1497,43 @@ function boreClassName(key){
   return `bore-marker bore-${String(key).toLowerCase().replace(/[^a-z0-9]+/g,'-')}`;
 }
 
+const ESC_RE = /[&<>"']/g;
 function escHtml(value){
-  return (value == null ? '' : String(value)).replace(/[&<>"']/g, ch => ESCAPE_HTML_LOOKUP[ch] || ch);
+  return (value == null ? '' : String(value)).replace(ESC_RE, ch => ESCAPE_HTML_LOOKUP[ch] || ch);
+}
+
+// Popup builders run only when a feature is clicked (bindPopup with a function).
+function formatLandtypePopup(p){
+  return `<b>${p.name || 'Unknown'}</b><br/>Code: <code>${p.code || 'UNK'}</code><br/>Area: ${(p.area_ha ?? 0).toFixed(2)} ha${p.lotplan ? `<br/>Lot/Plan: ${p.lotplan}` : ''}`;
+}
+
+function formatBorePopup(props){
+  const lines = [];
+  const num = props.bore_number || 'Unknown';
+  lines.push(`<strong>Bore ${escHtml(num)}</strong>`);
+  const statusText = props.status_label || props.status;
+  if (statusText){ lines.push(`<span class="muted">Status:</span> ${escHtml(statusText)}`); }
+  const typeText = props.type_label || props.type;
+  if (typeText){ lines.push(`<span class="muted">Type:</span> ${escHtml(typeText)}`); }
+  if (props.drilled_date){ lines.push(`<span class="muted">Drilled:</span> ${escHtml(props.drilled_date)}`); }
+  return lines.join('<br/>');
+}
+
+function formatEasementPopup(props){
+  const lines = [];
+  const title = props.name || props.alias;
+  lines.push(`<strong>${escHtml(title || 'Easement')}</strong>`);
+  if (props.alias && props.name){ lines.push(`<span class="muted">Alias:</span> ${escHtml(props.alias)}`); }
+  if (props.lotplan){ lines.push(`<span class="muted">Lot/Plan:</span> ${escHtml(props.lotplan)}`); }
+  if (props.parcel_type){ lines.push(`<span class="muted">Parcel Type:</span> ${escHtml(props.parcel_type)}`); }
+  if (props.tenure){ lines.push(`<span class="muted">Tenure:</span> ${escHtml(props.tenure)}`); }
+  const areaParts = [];
+  const areaHa = typeof props.area_ha === 'number' && !Number.isNaN(props.area_ha) ? props.area_ha : null;
+  const areaM2 = typeof props.area_m2 === 'number' && !Number.isNaN(props.area_m2) ? props.area_m2 : null;
+  if (areaHa != null){ areaParts.push(`${areaHa.toFixed(4)} ha`); }
+  if (areaM2 != null){ areaParts.push(`${areaM2.toLocaleString()} m²`); }
+  if (areaParts.length){ lines.push(`<span class="muted">Area:</span> ${areaParts.join(' / ')}`); }
+  return lines.join('<br/>');
 }
 
 function formatWaterPopup(props){
@@ -1089,23 +1575,30 @@ function formatWaterPopup(props){
 }
 
 function normText(s){ return (s || '').trim(); }
+// parseItems runs on every keystroke; compile its patterns once.
+const ON_WORD_RE = /\bON\b/g;
+const NON_ALNUM_RUN_RE = /[^A-Z0-9]+/g;
+const SPLIT_PLAN_RE = /\b([A-Z]{1,3}P)\s+(\d+)\b/g;
+const WHITESPACE_RE = /\s+/g;
+const NON_ALNUM_RE = /[^A-Z0-9]/g;
+const LOTPLAN_RE = /(?:^|\s)(?:LOT\s*)?(?<lot>[A-Z0-9]+?)(?:(?:\s*(?:SEC(?:TION)?|SEC\.)\s*(?<section_kw>[A-Z0-9]+))|(?:\s+(?<section_plain>\d+[A-Z0-9]*)))?(?:\s*(?:PLAN\s*)?)?(?<plan>[A-Z]+[A-Z0-9]+)(?=\s|$)/g;
 function parseItems(text){
   const cleaned = (text || '')
     .toUpperCase()
-    .replace(/\bON\b/g, ' ')
-    .replace(/[^A-Z0-9]+/g, ' ')
-    .replace(/\b([A-Z]{1,3}P)\s+(\d+)\b/g, '$1$2')
-    .replace(/\s+/g, ' ')
+    .replace(ON_WORD_RE, ' ')
+    .replace(NON_ALNUM_RUN_RE, ' ')
+    .replace(SPLIT_PLAN_RE, '$1$2')
+    .replace(WHITESPACE_RE, ' ')
     .trim();
   if (!cleaned) return [];
   const seen = new Set(); const out = [];
-  const rx = /(?:^|\s)(?:LOT\s*)?(?<lot>[A-Z0-9]+?)(?:(?:\s*(?:SEC(?:TION)?|SEC\.)\s*(?<section_kw>[A-Z0-9]+))|(?:\s+(?<section_plain>\d+[A-Z0-9]*)))?(?:\s*(?:PLAN\s*)?)?(?<plan>[A-Z]+[A-Z0-9]+)(?=\s|$)/g;
+  LOTPLAN_RE.lastIndex = 0;
   let m;
-  while((m = rx.exec(cleaned)) !== null){
-    const lot = (m.groups?.lot || '').replace(/[^A-Z0-9]/g, '');
-    const plan = (m.groups?.plan || '').replace(/[^A-Z0-9]/g, '');
+  while((m = LOTPLAN_RE.exec(cleaned)) !== null){
+    const lot = (m.groups?.lot || '').replace(NON_ALNUM_RE, '');
+    const plan = (m.groups?.plan || '').replace(NON_ALNUM_RE, '');
     if(!lot || !plan) continue;
-    let section = (m.groups?.section_kw || m.groups?.section_plain || '').replace(/[^A-Z0-9]/g, '');
+    let section = (m.groups?.section_kw || m.groups?.section_plain || '').replace(NON_ALNUM_RE, '');
     if(section === 'PLAN' || section === 'LOT') section = '';
     const parts = [lot];
     if(section) parts.push(section);
@@ -1139,11 +1632,65 @@ function ensureMap(){
   try{
     if (map) return;
     if (!window.L) return;
-    map = L.map('map', { zoomControl: true });
+    // One shared canvas instead of an SVG node per feature.
+    map = L.map('map', { zoomControl: true, preferCanvas: true, renderer: L.canvas({ padding: 0.5 }) });
     L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', { attribution: '&copy; OpenStreetMap' }).addTo(map);
     map.setView([-23.5, 146.0], 5);
   }catch(e){ console.warn('Map init failed:', e); }
 }
+const CLUSTER_THRESHOLD = 500;
+function shouldCluster(features){
+  return !!window.Supercluster && features.length > CLUSTER_THRESHOLD
+    && features.every(f => f && f.geometry && f.geometry.type === 'Point');
+}
+function clusteredPointLayer(features, toMarker, onEachFeature, clusterColor){
+  const index = new Supercluster({ radius: 60, maxZoom: 17 }).load(features);
+  const group = L.layerGroup();
+  let host = null;
+  const redraw = () => {
+    if (!host) return;
+    const bb = host.getBounds();
+    group.clearLayers();
+    for (const c of index.getClusters([bb.getWest(), bb.getSouth(), bb.getEast(), bb.getNorth()], Math.round(host.getZoom()))){
+      const [lng, lat] = c.geometry.coordinates;
+      const latlng = L.latLng(lat, lng);
+      if (c.properties && c.properties.cluster){
+        const n = c.properties.point_count;
+        const marker = L.circleMarker(latlng, { radius: Math.min(24, 8 + Math.log2(n) * 2), color: '#0c1325', weight: 1, fillColor: clusterColor, fillOpacity: 0.75 });
+        marker.bindTooltip(String(n), { permanent: true, direction: 'center', className: 'cluster-count' });
+        marker.on('click', () => host.setView(latlng, index.getClusterExpansionZoom(c.properties.cluster_id)));
+        group.addLayer(marker);
+      } else {
+        const layer = toMarker(c, latlng);
+        if (onEachFeature) onEachFeature(c, layer);
+        group.addLayer(layer);
+      }
+    }
+  };
+  const baseOnAdd = group.onAdd, baseOnRemove = group.onRemove;
+  group.onAdd = function(m){ baseOnAdd.call(this, m); host = m; host.on('moveend', redraw); redraw(); };
+  group.onRemove = function(m){ m.off('moveend', redraw); host = null; baseOnRemove.call(this, m); };
+  return group;
+}
+const SLICE_THRESHOLD = 1000;
+function shouldSlice(features){
+  return !!(window.L && L.vectorGrid && L.vectorGrid.slicer) && features.length > SLICE_THRESHOLD;
+}
+// Cut large GeoJSON into tiles in the browser (geojson-vt) so only on-screen tiles are drawn.
+function slicedLayer(data, style, popupFor){
+  const layer = L.vectorGrid.slicer(data, {
+    rendererFactory: L.canvas.tile,
+    maxZoom: 22,
+    tolerance: 3,
+    interactive: true,
+    vectorTileLayerStyles: { sliced: style }
+  });
+  layer.on('click', e => {
+    const html = popupFor((e.layer && e.layer.properties) || {});
+    if (html){ L.popup().setLatLng(e.latlng).setContent(html).openOn(map); }
+  });
+  return layer;
+}
 function styleForCode(code, colorHex){ return { color:'#0c1325', weight:1, fillColor:colorHex, fillOpacity:0.6 }; }
 function clearLayers(){
   try{
@@ -1154,7 +1701,23 @@ function clearLayers(){
     if(map && waterLayers.length){ waterLayers.forEach(layer => map.removeLayer(layer)); waterLayers=[]; }
   }catch{}
 }
-function mkVectorUrl(lotplan){ return `/vector?lotplan=${encodeURIComponent(lotplan)}`; }
+// Map preview geometry is simplified server-side (~1 m); exports keep full resolution.
+const MAP_SIMPLIFY = 0.00001;
+function mkVectorUrl(lotplan){ return `/vector?lotplan=${encodeURIComponent(lotplan)}&simplify_tolerance=${MAP_SIMPLIFY}`; }
+
+// Recently viewed /vector payloads, most recent last; re-displaying a lot skips the network.
+const VECTOR_CACHE_MAX = 10;
+const vectorCache = new Map();
+function vectorCacheGet(key){
+  const hit = vectorCache.get(key);
+  if (hit === undefined) return undefined;
+  vectorCache.delete(key); vectorCache.set(key, hit);
+  return hit;
+}
+function vectorCacheSet(key, data){
+  vectorCache.delete(key); vectorCache.set(key, data);
+  while (vectorCache.size > VECTOR_CACHE_MAX){ vectorCache.delete(vectorCache.keys().next().value); }
+}
 
 async function loadVector(){
   const items = parseItems($items.value);
@@ -1163,19 +1726,24 @@ async function loadVector(){
   const multi = items.length > 1;
   $out.textContent = multi ? `Loading vector data for ${items.length} lots/plans…` : 'Loading vector data…';
   try{
-    let res, data;
-    if (multi){
-      res = await fetch('/vector/bulk', { method:'POST', headers:{'Content-Type':'application/json'}, body: JSON.stringify({ lotplans: items }) });
-    } else {
-      res = await fetch(mkVectorUrl(items[0]));
-    }
-    data = await res.json();
-    if (!res.ok){
-      const msg = data && (data.detail || data.error) ? (data.detail || data.error) : 'Unexpected server response.';
-      $out.textContent = `Error ${res.status}: ${msg}`;
-      return;
+    const cacheKey = items.join('|');
+    let data = vectorCacheGet(cacheKey);
+    if (!data){
+      let res;
+      if (multi){
+        res = await fetch('/vector/bulk', { method:'POST', headers:{'Content-Type':'application/json'}, body: JSON.stringify({ lotplans: items, simplify_tolerance: MAP_SIMPLIFY }) });
+      } else {
+        res = await fetch(mkVectorUrl(items[0]));
+      }
+      data = await res.json();
+      if (!res.ok){
+        const msg = data && (data.detail || data.error) ? (data.detail || data.error) : 'Unexpected server response.';
+        $out.textContent = `Error ${res.status}: ${msg}`;
+        return;
+      }
+      if (data.error){ $out.textContent = 'Error: ' + data.error; return; }
+      vectorCacheSet(cacheKey, data);
     }
-    if (data.error){ $out.textContent = 'Error: ' + data.error; return; }
     clearLayers();
     const parcelData = data.parcels || data.parcel;
     if (parcelData){
@@ -1183,49 +1751,43 @@ async function loadVector(){
         style: { color: '#ffcc00', weight:2, fillOpacity:0 },
         onEachFeature: (feature, layer) => {
           const p = feature.properties || {};
-          if (p.lotplan){ layer.bindPopup(`<strong>Lot/Plan:</strong> ${p.lotplan}`); }
+          if (p.lotplan){ layer.bindPopup(() => `<strong>Lot/Plan:</strong> ${p.lotplan}`); }
         }
       }).addTo(map);
     }
     const ltData = data.landtypes;
     if (ltData && ltData.features && ltData.features.length){
-      ltLayer = L.geoJSON(ltData, { style: f => styleForCode(f.properties.code, f.properties.color_hex),
-        onEachFeature: (feature, layer) => {
-          const p = feature.properties || {};
-          const html = `<b>${p.name || 'Unknown'}</b><br/>Code: <code>${p.code || 'UNK'}</code><br/>Area: ${(p.area_ha ?? 0).toFixed(2)} ha${p.lotplan ? `<br/>Lot/Plan: ${p.lotplan}` : ''}`;
-          layer.bindPopup(html);
-        }}).addTo(map);
+      if (shouldSlice(ltData.features)){
+        ltLayer = slicedLayer(ltData, p => Object.assign({ fill: true }, styleForCode(p.code, p.color_hex)), formatLandtypePopup).addTo(map);
+      } else {
+        ltLayer = L.geoJSON(ltData, { style: f => styleForCode(f.properties.code, f.properties.color_hex),
+          onEachFeature: (feature, layer) => { layer.bindPopup(() => formatLandtypePopup(feature.properties || {})); }}).addTo(map);
+      }
     }
     const boreData = data.bores;
     if (boreData && Array.isArray(boreData.features) && boreData.features.length){
-      boreLayer = L.geoJSON(boreData, {
-        pointToLayer: (feature, latlng) => {
-          const props = feature.properties || {};
-          const color = colorForBoreStatus(props.status);
-          const cls = boreClassName(props.icon_key || props.status);
-          return L.circleMarker(latlng, {
-            radius: 6,
-            color,
-            weight: 1.5,
-            fillColor: color,
-            fillOpacity: 0.85,
-            className: cls
-          });
-        },
-        onEachFeature: (feature, layer) => {
-          const props = feature.properties || {};
-          const lines = [];
-          const num = props.bore_number || 'Unknown';
-          lines.push(`<strong>Bore ${escHtml(num)}</strong>`);
-          const statusText = props.status_label || props.status;
-          if (statusText){ lines.push(`<span class="muted">Status:</span> ${escHtml(statusText)}`); }
-          const typeText = props.type_label || props.type;
-          if (typeText){ lines.push(`<span class="muted">Type:</span> ${escHtml(typeText)}`); }
-          if (props.drilled_date){ lines.push(`<span class="muted">Drilled:</span> ${escHtml(props.drilled_date)}`); }
-          layer.bindPopup(lines.join('<br/>'));
-          if (props.bore_number){ layer.options.title = `Bore ${props.bore_number}`; }
-        }
-      }).addTo(map);
+      const boreMarker = (feature, latlng) => {
+        const props = feature.properties || {};
+        const color = colorForBoreStatus(props.status);
+        const cls = boreClassName(props.icon_key || props.status);
+        return L.circleMarker(latlng, {
+          radius: 6,
+          color,
+          weight: 1.5,
+          fillColor: color,
+          fillOpacity: 0.85,
+          className: cls
+        });
+      };
+      const bindBorePopup = (feature, layer) => {
+        const props = feature.properties || {};
+        layer.bindPopup(() => formatBorePopup(props));
+        if (props.bore_number){ layer.options.title = `Bore ${props.bore_number}`; }
+      };
+      boreLayer = (shouldCluster(boreData.features)
+        ? clusteredPointLayer(boreData.features, boreMarker, bindBorePopup, DEFAULT_BORE_COLOR)
+        : L.geoJSON(boreData, { pointToLayer: boreMarker, onEachFeature: bindBorePopup })
+      ).addTo(map);
     }
     const easementData = data.easements;
     if (easementData && Array.isArray(easementData.features) && easementData.features.length){
@@ -1233,21 +1795,7 @@ async function loadVector(){
       easementLayer = L.geoJSON(easementData, {
         style: () => easementStyle,
         onEachFeature: (feature, layer) => {
-          const props = feature.properties || {};
-          const lines = [];
-          const title = props.name || props.alias;
-          lines.push(`<strong>${escHtml(title || 'Easement')}</strong>`);
-          if (props.alias && props.name){ lines.push(`<span class="muted">Alias:</span> ${escHtml(props.alias)}`); }
-          if (props.lotplan){ lines.push(`<span class="muted">Lot/Plan:</span> ${escHtml(props.lotplan)}`); }
-          if (props.parcel_type){ lines.push(`<span class="muted">Parcel Type:</span> ${escHtml(props.parcel_type)}`); }
-          if (props.tenure){ lines.push(`<span class="muted">Tenure:</span> ${escHtml(props.tenure)}`); }
-          const areaParts = [];
-          const areaHa = typeof props.area_ha === 'number' && !Number.isNaN(props.area_ha) ? props.area_ha : null;
-          const areaM2 = typeof props.area_m2 === 'number' && !Number.isNaN(props.area_m2) ? props.area_m2 : null;
-          if (areaHa != null){ areaParts.push(`${areaHa.toFixed(4)} ha`); }
-          if (areaM2 != null){ areaParts.push(`${areaM2.toLocaleString()} m²`); }
-          if (areaParts.length){ lines.push(`<span class="muted">Area:</span> ${areaParts.join(' / ')}`); }
-          layer.bindPopup(lines.join('<br/>'));
+          layer.bindPopup(() => formatEasementPopup(feature.properties || {}));
         }
       }).addTo(map);
     }
@@ -1255,6 +1803,28 @@ async function loadVector(){
     for (const entry of waterData){
       if (!entry || !entry.features || !Array.isArray(entry.features.features) || !entry.features.features.length) continue;
       const color = colorForWaterLayer(entry.layer_id);
+      const waterMarker = (feature, latlng) => L.circleMarker(latlng, {
+        radius: 5,
+        color,
+        weight: 1.4,
+        fillColor: color,
+        fillOpacity: 0.85
+      });
+      const bindWaterPopup = (feature, layer) => {
+        layer.bindPopup(() => formatWaterPopup(feature && feature.properties));
+      };
+      if (shouldCluster(entry.features.features)){
+        waterLayers.push(clusteredPointLayer(entry.features.features, waterMarker, bindWaterPopup, color).addTo(map));
+        continue;
+      }
+      if (shouldSlice(entry.features.features)){
+        // VectorGrid passes geometry dimension: 1 point, 2 line, 3 polygon.
+        const waterStyle = (p, z, dim) => dim === 2 ? { color, weight: 2.5, opacity: 0.9 }
+          : dim === 3 ? { color: '#0c1325', weight: 1.2, fill: true, fillColor: color, fillOpacity: 0.35 }
+          : { radius: 5, color, weight: 1.4, fill: true, fillColor: color, fillOpacity: 0.85 };
+        waterLayers.push(slicedLayer(entry.features, waterStyle, formatWaterPopup).addTo(map));
+        continue;
+      }
       const geo = L.geoJSON(entry.features, {
         style: feature => {
           const geomType = feature && feature.geometry ? feature.geometry.type : null;
@@ -1266,17 +1836,8 @@ async function loadVector(){
           }
           return { color };
         },
-        pointToLayer: (feature, latlng) => L.circleMarker(latlng, {
-          radius: 5,
-          color,
-          weight: 1.4,
-          fillColor: color,
-          fillOpacity: 0.85
-        }),
-        onEachFeature: (feature, layer) => {
-          const html = formatWaterPopup(feature && feature.properties);
-          if (html){ layer.bindPopup(html); }
-        }
+        pointToLayer: waterMarker,
+        onEachFeature: bindWaterPopup
       }).addTo(map);
       waterLayers.push(geo);
     }
@@ -1346,9 +1907,14 @@ async function exportPropertyReport(){
   }catch(err){ $out.textContent = 'Network error: ' + err; }
 }
 
-$items.addEventListener('input', updateMode);
-$items.addEventListener('keyup', updateMode);
-$items.addEventListener('change', updateMode);
+// Reparse at most once per pause in typing/pasting rather than on every keystroke.
+let modeTimer = null;
+function scheduleUpdateMode(){
+  if (modeTimer) clearTimeout(modeTimer);
+  modeTimer = setTimeout(() => { modeTimer = null; updateMode(); }, 100);
+}
+$items.addEventListener('input', scheduleUpdateMode);
+$items.addEventListener('change', scheduleUpdateMode);
 $btnLoad.addEventListener('click', (e)=>{ e.preventDefault(); loadVector(); });
 $btnJson.addEventListener('click', (e)=>{ e.preventDefault(); previewJson(); });
 $btnExportReport.addEventListener('click', (e)=>{ e.preventDefault(); exportPropertyReport(); });
@@ -1367,7 +1933,7 @@ def export_geotiff(lotplan: str = Query(...), max_px: int = Query(4096, ge=256,
     lotplan = normalize_lotplan(lotplan)
     parcel_fc = fetch_parcel_geojson(lotplan)
     if not (parcel_fc or {}).get("features"):
-        return JSONResponse(
+        return ORJSONResponse(
             {
                 "lotplan": lotplan,
                 "error": f"Parcel '{lotplan}' not found.",
@@ -1386,35 +1952,155 @@ def export_geotiff(lotplan: str = Query(...), max_px: int = Query(4096, ge=256,
     clipped = prepare_clipped_shapes(parcel_fc, lt_fc)
     if not clipped:
         if download: raise HTTPException(status_code=404, detail="No Land Types intersect this parcel.")
-        return JSONResponse({"lotplan": lotplan, "error": "No Land Types intersect this parcel."}, status_code=404)
-    tmpdir = tempfile.mkdtemp(prefix="tiff_")
-    out_path = os.path.join(tmpdir, f"{lotplan}_landtypes.tif")
-    result = make_geotiff_rgba(clipped, out_path, max_px=max_px)
+        return ORJSONResponse({"lotplan": lotplan, "error": "No Land Types intersect this parcel."}, status_code=404)
+    data, public = geotiff_rgba_bytes(clipped, max_px=max_px)
     if download:
-        data = open(out_path, "rb").read()
-        os.remove(out_path); os.rmdir(tmpdir)
         return StreamingResponse(
             BytesIO(data),
             media_type="image/tiff",
             headers={"Content-Disposition": f'attachment; filename="{lotplan}_landtypes.tif"'},
         )
     else:
-        public = {k:v for k,v in result.items() if k != "path"}
-        legend: Dict[str, Dict[str, Any]] = {}
-        for _g, code, name, area_ha in clipped:
-            c = _hex(color_from_code(code))
-            legend.setdefault(code, {"code":code,"name":name,"color_hex":c,"area_ha":0.0})
-            legend[code]["area_ha"] += float(area_ha)
-        return JSONResponse({"lotplan": lotplan, "legend": sorted(legend.values(), key=lambda d: (-d["area_ha"], d["code"])), **public})
+        return ORJSONResponse({"lotplan": lotplan, "legend": _landtype_legend(clipped), **public})
+
+
+
+def _landtype_features(
+    clipped: Sequence[tuple], lotplan: str
+) -> Tuple[List[Dict[str, Any]], Optional[Tuple[float, float, float, float]], List[tuple]]:
+    """GeoJSON features, bounds and geometry-free legend rows for clipped landtypes.
+
+    Empty filtering, bounds and serialization each run once over the whole array.
+    """
+    if not clipped:
+        return [], None, []
+    geoms = np.empty(len(clipped), dtype=object)
+    geoms[:] = [item[0] for item in clipped]
+    keep = ~(shapely.is_missing(geoms) | shapely.is_empty(geoms))
+    rows = [item for item, kept in zip(clipped, keep.tolist()) if kept]
+    geoms = geoms[keep]
+    colors = {code: _hex(color_from_code(code)) for code in {row[1] for row in rows}}
+    features = [
+        {
+            "type": "Feature",
+            "geometry": geom_mapping,
+            "properties": {
+                "code": code,
+                "name": name,
+                "area_ha": float(area_ha),
+                "color_hex": colors[code],
+                "lotplan": lotplan,
+            },
+        }
+        for (_geom, code, name, area_ha), geom_mapping in zip(rows, _geometries_to_geojson(geoms))
+    ]
+    legend_rows = [(None, code, name, area_ha) for _geom, code, name, area_ha in rows]
+    return features, total_bounds(geoms), legend_rows
+
+
+def _bore_features(
+    bore_fc: Dict[str, Any], lotplan: str, seen: Set[str]
+) -> Tuple[List[Dict[str, Any]], Optional[Tuple[float, float, float, float]]]:
+    """GeoJSON bore features not already in ``seen`` (updated in place) and their bounds.
+
+    Shapely geometries live only for the duration of the call.
+    """
+    bore_list = bore_fc.get("features", [])
+    rows: List[Tuple[Any, BoreProps]] = []
+    for bore, geom in zip(bore_list, _geometries_from_features(bore_list)):
+        if geom is None:
+            continue
+        raw_props = bore.get("properties") or {}
+        bore_number = _bore_number_of(raw_props)
+        if not bore_number or bore_number in seen:
+            continue
+        norm_props = _normalize_bore_properties(raw_props, bore_number)
+        if not norm_props:
+            continue
+        seen.add(bore_number)
+        rows.append((geom, norm_props))
+
+    geoms = [geom for geom, _props in rows]
+    features = [
+        {
+            "type": "Feature",
+            "geometry": geometry,
+            "properties": props.as_dict(lotplan=lotplan),
+        }
+        for geometry, (_geom, props) in zip(_geometries_to_geojson(geoms), rows)
+    ]
+    return features, total_bounds(geoms)
+
+
+def _easement_features(
+    easement_fc: Dict[str, Any],
+    parcel_index: Optional[ParcelIndex],
+    lotplan: str,
+    simplify_tolerance: float = 0.0,
+) -> Tuple[List[Dict[str, Any]], Optional[Tuple[float, float, float, float]]]:
+    """GeoJSON easement features clipped to the parcel, plus their bounds."""
+    easement_list = easement_fc.get("features", [])
+    clipped = _clip_array_to_parcel(_geometries_from_features(easement_list), parcel_index)
+    rows: List[Tuple[Any, EasementProps]] = [
+        (clipped_geom, _normalize_easement_properties(easement.get("properties") or {}, lotplan))
+        for easement, clipped_geom in zip(easement_list, clipped)
+        if clipped_geom is not None
+    ]
+
+    geoms = _simplify_for_web([geom for geom, _props in rows], simplify_tolerance)
+    features = [
+        {
+            "type": "Feature",
+            "geometry": geometry,
+            "properties": props.as_dict(),
+        }
+        for geometry, (_clipped, props) in zip(_geometries_to_geojson(geoms), rows)
+    ]
+    return features, total_bounds(geoms)
+
 
+def _vector_landtype_features(
+    parcel_fc: Dict[str, Any], lt_fc: Dict[str, Any], lotplan: str, simplify_tolerance: float
+) -> Tuple[List[Dict[str, Any]], Optional[Tuple[float, float, float, float]], List[tuple]]:
+    """Clip and simplify fetched landtypes into ``_landtype_features`` output."""
+    clipped = prepare_clipped_shapes(parcel_fc, lt_fc)
+    if simplify_tolerance > 0:
+        simplified = _simplify_for_web([item[0] for item in clipped], simplify_tolerance)
+        clipped = [(geom, *item[1:]) for geom, item in zip(simplified, clipped)]
+    return _landtype_features(clipped, lotplan)
+
+
+def _water_layers_payload(
+    water_layers: Sequence[WaterLayerKMZ],
+) -> Tuple[List[Dict[str, Any]], Optional[Tuple[float, float, float, float]]]:
+    """/vector water entries for the non-empty prepared layers, plus their combined bounds."""
+    payload: List[Dict[str, Any]] = []
+    for layer in water_layers:
+        # Each WaterLayerKMZ owns a fresh list, so the payload can reference it directly.
+        features_list = layer.feature_collection.get("features") or []
+        if not features_list:
+            continue
+        payload.append(
+            {
+                "layer_id": layer.layer_id,
+                "layer_title": layer.layer_title,
+                "source_layer_name": layer.source_layer_name,
+                "features": {"type": "FeatureCollection", "features": features_list},
+            }
+        )
+    return payload, _water_layers_bounds(water_layers)
 
 
-@app.get("/vector")
-def vector_geojson(lotplan: str = Query(...)):
+@app.get("/vector", response_class=ORJSONResponse)
+def vector_geojson(
+    request: Request,
+    lotplan: str = Query(...),
+    simplify_tolerance: float = Query(0.0, ge=0.0, le=0.001),
+):
     lotplan = normalize_lotplan(lotplan)
     parcel_fc = fetch_parcel_geojson(lotplan)
     if not (parcel_fc or {}).get("features"):
-        return JSONResponse(
+        return ORJSONResponse(
             {
                 "lotplan": lotplan,
                 "error": f"Parcel '{lotplan}' not found.",
@@ -1428,118 +2114,38 @@ def vector_geojson(lotplan: str = Query(...)):
             status_code=404,
         )
     parcel_union = to_shapely_union(parcel_fc)
+    parcel_index = build_parcel_index(parcel_union)
     env = bbox_3857(parcel_union)
-    lt_fc = fetch_landtypes_intersecting_envelope(env)
-    clipped = prepare_clipped_shapes(parcel_fc, lt_fc)
-    bore_fc = fetch_bores_intersecting_envelope(env)
-    easement_fc = fetch_easements_intersecting_envelope(env)
-    water_layers_raw = fetch_water_layers_intersecting_envelope(env)
-    water_layers = _prepare_water_layers(parcel_fc, water_layers_raw, lotplan)
 
+    # parcel_fc is this request's own parse (the ArcGIS cache hands out copies), so tag it in place.
     for feature in parcel_fc.get("features", []):
-        props = feature.get("properties") or {}
-        if props.get("lotplan") == lotplan:
-            continue
-        new_props = dict(props)
-        new_props["lotplan"] = lotplan
-        feature["properties"] = new_props
-
-    features: List[Dict[str, Any]] = []
-    legend_map: Dict[str, Dict[str, Any]] = {}
-    for geom4326, code, name, area_ha in clipped:
-        color_hex = _hex(color_from_code(code))
-        features.append(
-            {
-                "type": "Feature",
-                "geometry": shp_mapping(geom4326),
-                "properties": {
-                    "code": code,
-                    "name": name,
-                    "area_ha": float(area_ha),
-                    "color_hex": color_hex,
-                    "lotplan": lotplan,
-                },
-            }
-        )
-        legend_map.setdefault(
-            code,
-            {"code": code, "name": name, "color_hex": color_hex, "area_ha": 0.0},
-        )
-        legend_map[code]["area_ha"] += float(area_ha)
-
-    bore_features: List[Dict[str, Any]] = []
-    seen_bores: Set[str] = set()
-    for bore in bore_fc.get("features", []):
-        try:
-            geom = shp_shape(bore.get("geometry"))
-        except Exception:
-            continue
-        if geom.is_empty:
-            continue
-        norm_props = _normalize_bore_properties(bore.get("properties") or {})
-        if not norm_props:
-            continue
-        bore_number = norm_props.get("bore_number")
-        if not bore_number or bore_number in seen_bores:
-            continue
-        seen_bores.add(bore_number)
-        norm_props["lotplan"] = lotplan
-        bore_features.append(
-            {
-                "type": "Feature",
-                "geometry": shp_mapping(geom),
-                "properties": norm_props,
-            }
-        )
-
-    easement_features: List[Dict[str, Any]] = []
-    for easement in easement_fc.get("features", []):
-        try:
-            geom = shp_shape(easement.get("geometry"))
-        except Exception:
-            continue
-        if geom.is_empty:
-            continue
-        clipped_geom = _clip_to_parcel_union(geom, parcel_union)
-        if clipped_geom is None or clipped_geom.is_empty:
-            continue
-        props = _normalize_easement_properties(easement.get("properties") or {}, lotplan)
-        easement_features.append(
-            {
-                "type": "Feature",
-                "geometry": shp_mapping(clipped_geom),
-                "properties": props,
-            }
-        )
-
-    water_layers_payload: List[Dict[str, Any]] = []
-    total_water_features = 0
-    for layer in water_layers:
-        fc = layer.feature_collection
-        features_list = list(fc.get("features", []))
-        total_water_features += len(features_list)
-        water_layers_payload.append(
-            {
-                "layer_id": layer.layer_id,
-                "layer_title": layer.layer_title,
-                "source_layer_name": layer.source_layer_name,
-                "features": {"type": "FeatureCollection", "features": features_list},
-            }
-        )
-
-    bounds_features: List[Dict[str, Any]] = []
-    bounds_features.extend(parcel_fc.get("features", []))
-    bounds_features.extend(features)
-    bounds_features.extend(bore_features)
-    bounds_features.extend(easement_features)
-    for layer_entry in water_layers_payload:
-        layer_features = layer_entry.get("features", {}).get("features", [])
-        bounds_features.extend(layer_features)
-
-    bounds_fc = {"type": "FeatureCollection", "features": bounds_features}
-    bounds_geom = to_shapely_union(bounds_fc)
-    bounds_dict = _bounds_dict_from_geom(bounds_geom, parcel_union)
-    has_data = bool(features or bore_features or easement_features or total_water_features)
+        props = feature.get("properties")
+        if not isinstance(props, dict):
+            props = feature["properties"] = {}
+        props["lotplan"] = lotplan
+
+    # The four layer queries overlap; each raw layer is then popped into the helper that
+    # reduces it to GeoJSON plus a bounds row, so its GEOS geometries are released before the next.
+    fetched = _fetch_envelope_layers(env)
+    features, landtype_bounds, legend_rows = _vector_landtype_features(
+        parcel_fc, fetched.pop("landtypes"), lotplan, simplify_tolerance
+    )
+    legend = _landtype_legend(legend_rows)
+    bore_features, bore_bounds = _bore_features(fetched.pop("bores"), lotplan, set())
+    easement_features, easement_bounds = _easement_features(
+        fetched.pop("easements"), parcel_index, lotplan, simplify_tolerance
+    )
+    water_layers_payload, water_bounds = _water_layers_payload(
+        _prepare_water_layers(parcel_fc, fetched.pop("water"), lotplan, simplify_tolerance)
+    )
+    bounds_rows = [landtype_bounds, bore_bounds, easement_bounds, water_bounds]
+    bounds_rows.extend(geojson_bounds(f.get("geometry") or {}) for f in parcel_fc.get("features", []))
+    bounds_rows = [row for row in bounds_rows if row is not None]
+    if bounds_rows:
+        bounds_dict = _bounds_dict(total_bounds_of(bounds_rows))
+    else:
+        bounds_dict = _bounds_dict_from_geom(None, parcel_union)
+    has_data = bool(features or bore_features or easement_features or water_layers_payload)
     status_code = 200 if has_data else 404
     payload = {
         "lotplan": lotplan,
@@ -1548,19 +2154,94 @@ def vector_geojson(lotplan: str = Query(...)):
         "bores": {"type": "FeatureCollection", "features": bore_features},
         "easements": {"type": "FeatureCollection", "features": easement_features},
         "water": {"layers": water_layers_payload},
-        "legend": sorted(legend_map.values(), key=lambda d: (-d["area_ha"], d["code"])),
+        "legend": legend,
         "bounds4326": bounds_dict,
     }
     if status_code != 200:
         payload["error"] = "No Land Types intersect this parcel."
-    return JSONResponse(payload, status_code=status_code)
+        return ORJSONResponse(payload, status_code=status_code)
+    return _with_etag(request, ORJSONResponse(payload))
+
+
+def _fetch_envelope_layers(env) -> Dict[str, Any]:
+    return _fetch_concurrently(
+        {
+            "landtypes": lambda: fetch_landtypes_intersecting_envelope(env),
+            "bores": lambda: fetch_bores_intersecting_envelope(env),
+            "easements": lambda: fetch_easements_intersecting_envelope(env),
+            "water": lambda: fetch_water_layers_intersecting_envelope(env),
+        }
+    )
+
+
+def _fc_feature_bounds(fc: Dict[str, Any]) -> np.ndarray:
+    rows = []
+    for feature in (fc or {}).get("features", []):
+        bounds = geojson_bounds(feature.get("geometry") or {})
+        rows.append(bounds if bounds is not None else (np.nan, np.nan, np.nan, np.nan))
+    return np.asarray(rows, dtype=np.float64).reshape(-1, 4)
+
+
+def _split_fc_by_lots(fc: Dict[str, Any], lot_boxes: np.ndarray) -> List[Dict[str, Any]]:
+    """Split ``fc`` into one collection per lot box (features with unknown bounds go to every lot).
+
+    The feature envelopes go into one STRtree that is queried with all lot boxes
+    at once, instead of rescanning every feature for every lot.
+    """
+    features = (fc or {}).get("features", [])
+    if not features:
+        return [{"type": "FeatureCollection", "features": []} for _ in range(len(lot_boxes))]
+    feature_bounds = _fc_feature_bounds(fc)
+    known = ~np.isnan(feature_bounds).any(axis=1)
+    known_idx = np.flatnonzero(known)
+    unknown_idx = np.flatnonzero(~known)
+    # Envelope of the two corners: a Point or LineString for degenerate boxes, so bores index correctly.
+    corners = feature_bounds[known_idx].reshape(-1, 2, 2)
+    tree = shapely.STRtree(shapely.envelope(shapely.multipoints(corners)))
+    lot_idx, hit_idx = tree.query(shapely.box(*lot_boxes.T), predicate="intersects")
+    per_lot: List[List[int]] = [unknown_idx.tolist() for _ in range(len(lot_boxes))]
+    for lot, hit in zip(lot_idx.tolist(), known_idx[hit_idx].tolist()):
+        per_lot[lot].append(hit)
+    return [
+        {"type": "FeatureCollection", "features": [features[i] for i in sorted(indices)]}
+        for indices in per_lot
+    ]
+
+
+def _fetch_bulk_layers(parcel_unions: Sequence[Any], pool: ThreadPoolExecutor) -> List[Dict[str, Any]]:
+    """Fetch envelope layers for every lot.
+
+    Lots that sit close together share one query per layer over their combined
+    envelope, and each lot then takes the features overlapping its own bounds.
+    """
+    envs = [bbox_3857(union) for union in parcel_unions]
+    if len(envs) > 1:
+        xmin, ymin, xmax, ymax = total_bounds_of(envs)
+        if max(xmax - xmin, ymax - ymin) <= BULK_BATCH_MAX_SPAN_M:
+            shared = _fetch_envelope_layers((xmin, ymin, xmax, ymax))
+            lot_boxes = np.asarray([union.bounds for union in parcel_unions], dtype=np.float64)
+            split = {
+                name: _split_fc_by_lots(shared[name], lot_boxes) for name in ("landtypes", "bores", "easements")
+            }
+            water = [
+                (layer, _split_fc_by_lots(layer.get("feature_collection") or {}, lot_boxes))
+                for layer in shared["water"] or []
+            ]
+            out: List[Dict[str, Any]] = []
+            for i in range(len(parcel_unions)):
+                entry: Dict[str, Any] = {name: per_lot[i] for name, per_lot in split.items()}
+                entry["water"] = [dict(layer, feature_collection=per_lot[i]) for layer, per_lot in water]
+                out.append(entry)
+            return out
+    return list(pool.map(_fetch_envelope_layers, envs))
 
 
 class VectorBulkRequest(BaseModel):
     lotplans: List[str] = Field(..., min_length=1)
+    simplify_tolerance: float = Field(0.0, ge=0.0, le=0.001)
 
 
-@app.post("/vector/bulk")
+@app.post("/vector/bulk", response_class=ORJSONResponse)
 def vector_geojson_bulk(payload: VectorBulkRequest):
     seen = set()
     lotplans: List[str] = []
@@ -1576,103 +2257,72 @@ def vector_geojson_bulk(payload: VectorBulkRequest):
 
     if not lotplans:
         raise HTTPException(status_code=400, detail="No valid lot/plan codes provided.")
+    simplify_tolerance = payload.simplify_tolerance or 0.0
 
     parcel_features: List[Dict[str, Any]] = []
     landtype_features: List[Dict[str, Any]] = []
     bore_features: List[Dict[str, Any]] = []
     easement_features: List[Dict[str, Any]] = []
-    legend_map: Dict[str, Dict[str, Any]] = {}
-    bounds = None
+    legend_rows: List[tuple] = []
+    # One (minx, miny, maxx, maxy) row per collection; geometries are not kept across lots.
+    bounds_rows: List[Optional[Tuple[float, float, float, float]]] = []
     seen_bore_numbers: Set[str] = set()
     water_layers_map: Dict[int, Dict[str, Any]] = {}
 
-    def expand_bounds(current, geom):
-        if geom.is_empty:
-            return current
-        minx, miny, maxx, maxy = geom.bounds
-        if current is None:
-            return [minx, miny, maxx, maxy]
-        current[0] = min(current[0], minx)
-        current[1] = min(current[1], miny)
-        current[2] = max(current[2], maxx)
-        current[3] = max(current[3], maxy)
-        return current
-
-    for lotplan in lotplans:
-        parcel_fc = fetch_parcel_geojson(lotplan)
-        if not (parcel_fc or {}).get("features"):
-            continue
-        parcel_union = to_shapely_union(parcel_fc)
-        env = bbox_3857(parcel_union)
-
-        for feature in parcel_fc.get("features", []):
-            try:
-                geom = shp_shape(feature.get("geometry"))
-            except Exception:
+    # Network-bound: fetch lots side by side (bounded so ArcGIS isn't flooded), assemble in order.
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(BULK_LOT_WORKERS, len(lotplans))),
+        thread_name_prefix="bulk-lot",
+    ) as pool:
+        parcel_fcs = list(pool.map(fetch_parcel_geojson, lotplans))
+        lots: List[Tuple[str, Dict[str, Any], Any]] = []
+        for lotplan, parcel_fc in zip(lotplans, parcel_fcs):
+            if not (parcel_fc or {}).get("features"):
                 continue
-            if geom.is_empty:
-                continue
-            bounds = expand_bounds(bounds, geom)
-            props = dict(feature.get("properties") or {})
+            lots.append((lotplan, parcel_fc, to_shapely_union(parcel_fc)))
+        lot_layers = _fetch_bulk_layers([union for _lp, _fc, union in lots], pool)
+
+    for index, (lotplan, parcel_fc, parcel_union) in enumerate(lots):
+        fetched = lot_layers[index]
+        lot_layers[index] = None  # release this lot's raw layers once it has been assembled
+        parcel_index = build_parcel_index(parcel_union)
+
+        parcel_list = parcel_fc.get("features", [])
+        parcel_geoms = _geometries_from_features(parcel_list)
+        kept = parcel_geoms[~shapely.is_missing(parcel_geoms)]
+        bounds_rows.append(total_bounds(kept))
+        kept_features = [feature for feature, geom in zip(parcel_list, parcel_geoms) if geom is not None]
+        for feature, geometry in zip(kept_features, _geometries_to_geojson(kept)):
+            props = feature.get("properties")
+            if not isinstance(props, dict):
+                props = {}
             props["lotplan"] = lotplan
             parcel_features.append({
                 "type": "Feature",
-                "geometry": shp_mapping(geom),
+                "geometry": geometry,
                 "properties": props,
             })
 
-        lt_fc = fetch_landtypes_intersecting_envelope(env)
-        clipped = prepare_clipped_shapes(parcel_fc, lt_fc)
-        bore_fc = fetch_bores_intersecting_envelope(env)
-        easement_fc = fetch_easements_intersecting_envelope(env)
-        water_layers_raw = fetch_water_layers_intersecting_envelope(env)
-        water_layers = _prepare_water_layers(parcel_fc, water_layers_raw, lotplan)
+        clipped = prepare_clipped_shapes(parcel_fc, fetched["landtypes"])
+        bore_fc = fetched["bores"]
+        easement_fc = fetched["easements"]
+        water_layers = _prepare_water_layers(parcel_fc, fetched["water"], lotplan, simplify_tolerance)
+        if simplify_tolerance > 0:
+            simplified = _simplify_for_web([item[0] for item in clipped], simplify_tolerance)
+            clipped = [(geom, *item[1:]) for geom, item in zip(simplified, clipped)]
 
-        for bore in bore_fc.get("features", []):
-            try:
-                geom = shp_shape(bore.get("geometry"))
-            except Exception:
-                continue
-            if geom.is_empty:
-                continue
-            norm_props = _normalize_bore_properties(bore.get("properties") or {})
-            if not norm_props:
-                continue
-            bore_number = norm_props.get("bore_number")
-            if not bore_number or bore_number in seen_bore_numbers:
-                continue
-            seen_bore_numbers.add(bore_number)
-            norm_props["lotplan"] = lotplan
-            bore_features.append({
-                "type": "Feature",
-                "geometry": shp_mapping(geom),
-                "properties": norm_props,
-            })
-            bounds = expand_bounds(bounds, geom)
+        lot_bores, lot_bore_bounds = _bore_features(bore_fc, lotplan, seen_bore_numbers)
+        bore_features.extend(lot_bores)
+        bounds_rows.append(lot_bore_bounds)
 
-        for easement in easement_fc.get("features", []):
-            try:
-                geom = shp_shape(easement.get("geometry"))
-            except Exception:
-                continue
-            if geom.is_empty:
-                continue
-            clipped_geom = _clip_to_parcel_union(geom, parcel_union)
-            if clipped_geom is None or clipped_geom.is_empty:
-                continue
-            props = _normalize_easement_properties(easement.get("properties") or {}, lotplan)
-            easement_features.append(
-                {
-                    "type": "Feature",
-                    "geometry": shp_mapping(clipped_geom),
-                    "properties": props,
-                }
-            )
-            bounds = expand_bounds(bounds, clipped_geom)
+        lot_easements, lot_easement_bounds = _easement_features(
+            easement_fc, parcel_index, lotplan, simplify_tolerance
+        )
+        easement_features.extend(lot_easements)
+        bounds_rows.append(lot_easement_bounds)
 
         for layer in water_layers:
-            fc = layer.feature_collection
-            features_list = list(fc.get("features", []))
+            features_list = layer.feature_collection.get("features") or []
             if not features_list:
                 continue
             entry = water_layers_map.setdefault(
@@ -1685,38 +2335,12 @@ def vector_geojson_bulk(payload: VectorBulkRequest):
                 },
             )
             entry["features"].extend(features_list)
-            for feature in features_list:
-                try:
-                    geom = shp_shape(feature.get("geometry"))
-                except Exception:
-                    continue
-                if geom.is_empty:
-                    continue
-                bounds = expand_bounds(bounds, geom)
-
-        for geom4326, code, name, area_ha in clipped:
-            if geom4326.is_empty:
-                continue
-            bounds = expand_bounds(bounds, geom4326)
-            color_hex = _hex(color_from_code(code))
-            landtype_features.append({
-                "type": "Feature",
-                "geometry": shp_mapping(geom4326),
-                "properties": {
-                    "code": code,
-                    "name": name,
-                    "area_ha": float(area_ha),
-                    "color_hex": color_hex,
-                    "lotplan": lotplan,
-                },
-            })
-            legend_map.setdefault(code, {
-                "code": code,
-                "name": name,
-                "color_hex": color_hex,
-                "area_ha": 0.0,
-            })
-            legend_map[code]["area_ha"] += float(area_ha)
+        bounds_rows.append(_water_layers_bounds(water_layers))
+
+        lot_landtypes, lot_landtype_bounds, lot_legend_rows = _landtype_features(clipped, lotplan)
+        landtype_features.extend(lot_landtypes)
+        bounds_rows.append(lot_landtype_bounds)
+        legend_rows.extend(lot_legend_rows)
 
     if (
         not parcel_features
@@ -1727,10 +2351,8 @@ def vector_geojson_bulk(payload: VectorBulkRequest):
     ):
         raise HTTPException(status_code=404, detail="No features found for the provided lots/plans.")
 
-    bounds_dict = None
-    if bounds is not None:
-        west, south, east, north = bounds
-        bounds_dict = {"west": west, "south": south, "east": east, "north": north}
+    bounds_rows = [row for row in bounds_rows if row is not None]
+    bounds_dict = _bounds_dict(total_bounds_of(bounds_rows)) if bounds_rows else None
 
     water_layers_payload = []
     for layer_id, entry in sorted(water_layers_map.items()):
@@ -1739,18 +2361,18 @@ def vector_geojson_bulk(payload: VectorBulkRequest):
                 "layer_id": entry["layer_id"],
                 "layer_title": entry["layer_title"],
                 "source_layer_name": entry["source_layer_name"],
-                "features": {"type": "FeatureCollection", "features": list(entry.get("features", []))},
+                "features": {"type": "FeatureCollection", "features": entry["features"]},
             }
         )
 
-    return JSONResponse({
+    return ORJSONResponse({
         "lotplans": lotplans,
         "parcels": {"type": "FeatureCollection", "features": parcel_features},
         "landtypes": {"type": "FeatureCollection", "features": landtype_features},
         "bores": {"type": "FeatureCollection", "features": bore_features},
         "easements": {"type": "FeatureCollection", "features": easement_features},
         "water": {"layers": water_layers_payload},
-        "legend": sorted(legend_map.values(), key=lambda d: (-d["area_ha"], d["code"])),
+        "legend": _landtype_legend(legend_rows),
         "bounds4326": bounds_dict,
     })
 
@@ -1773,7 +2395,7 @@ def export_kmz(
     )
 
     return StreamingResponse(
-        BytesIO(report.kmz_bytes),
+        report.iter_kmz(),
         media_type="application/vnd.google-earth.kmz",
         headers={"Content-Disposition": _content_disposition(report.filename)},
     )
@@ -1806,31 +2428,16 @@ def export_kml(
         veg_fc = fetch_features_intersecting_envelope(
             veg_service_url, veg_layer_id, env, out_fields="*"
         )
-        # standardise fields
-        for f in veg_fc.get("features", []):
-            props = f.get("properties") or {}
-            code = str(props.get(veg_code_field or "code") or props.get("code") or "").strip()
-            name = str(props.get(veg_name_field or "name") or props.get("name") or code).strip()
-            props["code"] = code or name or "UNK"
-            # Format vegetation names as "Category *"
-            category_name = name or code or "Unknown"
-            props["name"] = f"Category {category_name}"
+        _standardise_veg_features(veg_fc, veg_code_field, veg_name_field)
         veg_clipped = prepare_clipped_shapes(parcel_fc, veg_fc)
 
     if simplify_tolerance and simplify_tolerance > 0:
-        def _simp(data):
-            out = []
-            for geom4326, code, name, area_ha in data:
-                g2 = geom4326.simplify(simplify_tolerance, preserve_topology=True)
-                if not g2.is_empty:
-                    out.append((g2, code, name, area_ha))
-            return out or data
-        lt_clipped = _simp(lt_clipped)
+        lt_clipped = _simplify_clipped(lt_clipped, simplify_tolerance)
         if veg_clipped:
-            veg_clipped = _simp(veg_clipped)
+            veg_clipped = _simplify_clipped(veg_clipped, simplify_tolerance)
 
     if bore_points:
-        bore_points = _inline_point_icon_hrefs(bore_points, bore_assets)
+        _inline_point_icon_hrefs(bore_points, bore_assets)
 
     kml = _render_parcel_kml(lotplan, lt_clipped, veg_clipped, bore_points)
 
@@ -1849,11 +2456,9 @@ class ExportAnyRequest(BaseModel):
     simplify_tolerance: float = Field(0.0, ge=0.0, le=0.001)
 
 
-def _prefixed_report_filename(lotplan: str, prefix: Optional[str]) -> str:
+def _prefixed_report_filename(lotplan: str, clean: Optional[str]) -> str:
+    """Report filename for ``lotplan``; ``clean`` is a prefix already run through _sanitize_filename."""
     base = f"Property Report – {lotplan}.kmz"
-    if not prefix:
-        return base
-    clean = _sanitize_filename(prefix)
     if not clean:
         return base
     if clean.lower().endswith(".kmz"):
@@ -1861,21 +2466,48 @@ def _prefixed_report_filename(lotplan: str, prefix: Optional[str]) -> str:
     return f"{clean} – {base}"
 
 
-def _create_bulk_kmz(
-    items: Sequence[str],
+# Built reports are immutable (frozen dataclasses, read-only mappings), so hits are shared as-is.
+# They expire with the ArcGIS query cache so a re-export never sees older data than a fresh one.
+_REPORT_CACHE = TTLCache(maxsize=REPORT_CACHE_MAXSIZE, ttl=ARCGIS_CACHE_TTL)
+
+
+def _cached_property_report(
+    lotplan: str,
     *,
     simplify_tolerance: float,
     veg_service_url: Optional[str],
     veg_layer_id: Optional[int],
     veg_name_field: Optional[str],
     veg_code_field: Optional[str],
-    filename: Optional[str] = None,
-) -> StreamingResponse:
-    nested_groups = []
-    kmz_assets: Dict[str, bytes] = {}
-
-    for lp in items:
+) -> PropertyReportKMZ:
+    """``build_property_report_kmz`` memoized on the lot and every option that shapes the report."""
+    key = (lotplan, float(simplify_tolerance or 0.0), veg_service_url, veg_layer_id, veg_name_field, veg_code_field)
+    report = _REPORT_CACHE.get(key)
+    if report is None:
         report = build_property_report_kmz(
+            lotplan,
+            simplify_tolerance=simplify_tolerance,
+            veg_service_url=veg_service_url,
+            veg_layer_id=veg_layer_id,
+            veg_name_field=veg_name_field,
+            veg_code_field=veg_code_field,
+        )
+        _REPORT_CACHE.set(key, report)
+    return report
+
+
+def _build_reports(
+    items: Sequence[str],
+    *,
+    simplify_tolerance: float,
+    veg_service_url: Optional[str],
+    veg_layer_id: Optional[int],
+    veg_name_field: Optional[str],
+    veg_code_field: Optional[str],
+) -> List[PropertyReportKMZ]:
+    """Build one report per lot side by side, returned in ``items`` order."""
+    def _build(lp: str) -> PropertyReportKMZ:
+        return _cached_property_report(
             lp,
             simplify_tolerance=simplify_tolerance,
             veg_service_url=veg_service_url,
@@ -1884,29 +2516,55 @@ def _create_bulk_kmz(
             veg_code_field=veg_code_field,
         )
 
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(BULK_LOT_WORKERS, len(items))),
+        thread_name_prefix="bulk-report",
+    ) as pool:
+        return list(pool.map(_build, items))
+
+
+def _create_bulk_kmz(
+    items: Sequence[str],
+    *,
+    simplify_tolerance: float,
+    veg_service_url: Optional[str],
+    veg_layer_id: Optional[int],
+    veg_name_field: Optional[str],
+    veg_code_field: Optional[str],
+    clean_filename: Optional[str] = None,
+) -> StreamingResponse:
+    nested_groups = []
+    kmz_assets: Dict[str, bytes] = {}
+
+    reports = _build_reports(
+        items,
+        simplify_tolerance=simplify_tolerance,
+        veg_service_url=veg_service_url,
+        veg_layer_id=veg_layer_id,
+        veg_name_field=veg_name_field,
+        veg_code_field=veg_code_field,
+    )
+    for report in reports:
         subgroups: List[tuple] = []
         if report.landtypes:
-            subgroups.append((list(report.landtypes), color_from_code, "Land Types"))
+            subgroups.append((report.landtypes, color_from_code, "Land Types"))
         if report.vegetation:
-            subgroups.append((list(report.vegetation), color_from_code, "Vegetation"))
+            subgroups.append((report.vegetation, color_from_code, "Vegetation"))
         if report.easements:
-            mapping = dict(report.easement_color_map)
-
-            def _color_fn(code: str, _mapping=mapping) -> Tuple[int, int, int]:
-                base = _mapping.get(code, code)
-                return color_from_code(base)
-
-            subgroups.append((list(report.easements), _color_fn, "Easements"))
+            easement_color_fn = partial(_easement_color, mapping=report.easement_color_map)
+            subgroups.append((report.easements, easement_color_fn, "Easements"))
 
         water_children: List[tuple] = []
         if report.bore_points:
-            water_children.append(([], color_from_code, BORE_FOLDER_NAME, list(report.bore_points)))
+            water_children.append(([], color_from_code, BORE_FOLDER_NAME, report.bore_points))
         for layer in report.water_layers:
-            def _water_color_fn(code: str, _layer_id=layer.layer_id) -> Tuple[int, int, int]:
-                return color_from_code(f"WATER-{_layer_id}")
-
             water_children.append(
-                (list(layer.shapes), _water_color_fn, layer.layer_title, list(layer.points))
+                (
+                    layer.shapes,
+                    partial(_water_color, layer_id=layer.layer_id),
+                    layer.layer_title,
+                    layer.points,
+                )
             )
 
         if water_children:
@@ -1921,7 +2579,7 @@ def _create_bulk_kmz(
     if not nested_groups:
         raise HTTPException(status_code=404, detail="No data found for the provided lots/plans.")
 
-    doc_label = _sanitize_filename(filename) if filename else None
+    doc_label = clean_filename
     if doc_label:
         if doc_label.lower().endswith(".kmz"):
             doc_label = doc_label[:-4]
@@ -1932,26 +2590,9 @@ def _create_bulk_kmz(
 
     kml = build_kml_nested_folders(nested_groups, doc_name=doc_label)
 
-    tmpdir = tempfile.mkdtemp(prefix="kmz_")
     download_name = doc_label
-    out_path = os.path.join(tmpdir, f"{download_name}.kmz")
-    try:
-        write_kmz(kml, out_path, assets=kmz_assets)
-        with open(out_path, "rb") as fh:
-            kmz_bytes = fh.read()
-    finally:
-        try:
-            if os.path.exists(out_path):
-                os.remove(out_path)
-        except Exception:
-            pass
-        try:
-            os.rmdir(tmpdir)
-        except Exception:
-            pass
-
     return StreamingResponse(
-        BytesIO(kmz_bytes),
+        iter_kmz(kml, kmz_assets),
         media_type="application/vnd.google-earth.kmz",
         headers={"Content-Disposition": _content_disposition(f"{download_name}.kmz")},
     )
@@ -1965,37 +2606,33 @@ def _create_property_report_zip(
     veg_layer_id: Optional[int],
     veg_name_field: Optional[str],
     veg_code_field: Optional[str],
-    filename_prefix: Optional[str] = None,
+    clean_prefix: Optional[str] = None,
 ) -> StreamingResponse:
-    reports: List[PropertyReportKMZ] = []
-    for lp in items:
-        report = build_property_report_kmz(
-            lp,
-            simplify_tolerance=simplify_tolerance,
-            veg_service_url=veg_service_url,
-            veg_layer_id=veg_layer_id,
-            veg_name_field=veg_name_field,
-            veg_code_field=veg_code_field,
-        )
-        reports.append(report)
-
-    zip_buf = BytesIO()
-    prefix_clean = _sanitize_filename(filename_prefix) if filename_prefix else None
+    # Every report is built (side by side) before the response starts, so a failing lot
+    # still fails the request with its HTTP status instead of truncating the archive.
+    reports = _build_reports(
+        items,
+        simplify_tolerance=simplify_tolerance,
+        veg_service_url=veg_service_url,
+        veg_layer_id=veg_layer_id,
+        veg_name_field=veg_name_field,
+        veg_code_field=veg_code_field,
+    )
 
-    with zipfile.ZipFile(zip_buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+    def _entries() -> Iterator[Tuple[str, Iterator[bytes]]]:
+        # Reports hold only their KML; each KMZ is deflated as its entry is streamed.
         for report in reports:
             entry_name = report.filename
-            if prefix_clean:
-                entry_name = _prefixed_report_filename(report.lotplan, prefix_clean)
-            zf.writestr(entry_name, report.kmz_bytes)
+            if clean_prefix:
+                entry_name = _prefixed_report_filename(report.lotplan, clean_prefix)
+            yield entry_name, report.iter_kmz()
 
-    zip_buf.seek(0)
     stamp = dt.datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-    base_name = prefix_clean or "Property Reports"
+    base_name = clean_prefix or "Property Reports"
     zip_name = f"{base_name}_{stamp}.zip"
 
     return StreamingResponse(
-        zip_buf,
+        iter_zip(_entries()),
         media_type="application/zip",
         headers={"Content-Disposition": _content_disposition(zip_name)},
     )
@@ -2022,9 +2659,11 @@ def export_any(payload: ExportAnyRequest = Body(...)):
 
     simplify = payload.simplify_tolerance or 0.0
     veg_url, veg_layer, veg_name, veg_code = _default_veg_config()
+    # Sanitized once here; the helpers below take the cleaned names as-is.
+    clean_filename = _sanitize_filename(payload.filename) if payload.filename else None
 
     if len(items) == 1:
-        report = build_property_report_kmz(
+        report = _cached_property_report(
             items[0],
             simplify_tolerance=simplify,
             veg_service_url=veg_url,
@@ -2032,10 +2671,9 @@ def export_any(payload: ExportAnyRequest = Body(...)):
             veg_name_field=veg_name,
             veg_code_field=veg_code,
         )
-        prefix = _sanitize_filename(payload.filename) if payload.filename else None
-        download_name = _prefixed_report_filename(report.lotplan, prefix)
+        download_name = _prefixed_report_filename(report.lotplan, clean_filename)
         return StreamingResponse(
-            BytesIO(report.kmz_bytes),
+            report.iter_kmz(),
             media_type="application/vnd.google-earth.kmz",
             headers={"Content-Disposition": _content_disposition(download_name)},
         )
@@ -2048,7 +2686,7 @@ def export_any(payload: ExportAnyRequest = Body(...)):
             veg_layer_id=veg_layer,
             veg_name_field=veg_name,
             veg_code_field=veg_code,
-            filename_prefix=payload.filename_prefix,
+            clean_prefix=_sanitize_filename(payload.filename_prefix) or None,
         )
 
     return _create_bulk_kmz(
@@ -2058,5 +2696,5 @@ def export_any(payload: ExportAnyRequest = Body(...)):
         veg_layer_id=veg_layer,
         veg_name_field=veg_name,
         veg_code_field=veg_code,
-        filename=payload.filename,
+        clean_filename=clean_filename,
     )
@@ -2,30 +2,29 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 import rasterio
+from rasterio.io import MemoryFile
 from rasterio.features import rasterize
 from rasterio.transform import from_bounds
 from shapely.geometry import mapping
 
 from .colors import color_from_code
+from .geometry import total_bounds
 
 
-def make_geotiff_rgba(clipped: List[tuple], out_path: str, max_px: int = 4096) -> Dict[str, Any]:
-    """
-    Rasterize the clipped polygons (EPSG:4326) into an RGBA GeoTIFF in EPSG:4326.
-    Each tuple: (geom4326, code, name, area_ha). Colors are derived from code.
-    Returns a small dict including path and size.
-    """
+def _render_rgba(clipped: List[tuple], max_px: int) -> Tuple[np.ndarray, Dict[str, Any], List[float]]:
+    """Paint the clipped polygons into a (4, height, width) RGBA array plus its GTiff profile."""
     if not clipped:
         raise ValueError("No polygons to rasterize.")
 
-    # Union bounds in 4326
-    from shapely.ops import unary_union
-    geom_union = unary_union([g for g, _, _, _ in clipped])
-    minx, miny, maxx, maxy = geom_union.bounds
+    # Combined bounds in 4326 (no need to union the shapes just for their extent)
+    bounds = total_bounds(g for g, _, _, _ in clipped)
+    if bounds is None:
+        raise ValueError("Invalid bounds for rasterization.")
+    minx, miny, maxx, maxy = bounds
     width_deg = maxx - minx
     height_deg = maxy - miny
     if width_deg <= 0 or height_deg <= 0:
@@ -81,11 +80,32 @@ def make_geotiff_rgba(clipped: List[tuple], out_path: str, max_px: int = 4096) -
         "interleave": "pixel",
         "compress": "deflate",
     }
+    return np.stack((R, G, B, A)), profile, [minx, miny, maxx, maxy]
+
+
+def make_geotiff_rgba(clipped: List[tuple], out_path: str, max_px: int = 4096) -> Dict[str, Any]:
+    """
+    Rasterize the clipped polygons (EPSG:4326) into an RGBA GeoTIFF in EPSG:4326.
+    Each tuple: (geom4326, code, name, area_ha). Colors are derived from code.
+    Returns a small dict including path and size.
+    """
+    rgba, profile, bounds = _render_rgba(clipped, max_px)
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
     with rasterio.open(out_path, "w", **profile) as dst:
-        dst.write(R, 1)
-        dst.write(G, 2)
-        dst.write(B, 3)
-        dst.write(A, 4)
+        dst.write(rgba)
+
+    return {"path": out_path, "width": profile["width"], "height": profile["height"], "bounds": bounds}
+
+
+def geotiff_rgba_bytes(clipped: List[tuple], max_px: int = 4096) -> Tuple[bytes, Dict[str, Any]]:
+    """
+    Same as make_geotiff_rgba, but the GeoTIFF is built in a rasterio MemoryFile
+    and returned as bytes alongside the size/bounds dict; nothing touches disk.
+    """
+    rgba, profile, bounds = _render_rgba(clipped, max_px)
+    with MemoryFile() as memfile:
+        with memfile.open(**profile) as dst:
+            dst.write(rgba)
+        data = memfile.read()
 
-    return {"path": out_path, "width": width, "height": height, "bounds": [minx, miny, maxx, maxy]}
+    return data, {"width": profile["width"], "height": profile["height"], "bounds": bounds}
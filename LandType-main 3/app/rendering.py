@@ -3,6 +3,7 @@ from typing import Dict, List, Tuple
 
 import numpy as np
 import rasterio
+import shapely
 from pyproj import Transformer
 from rasterio.features import rasterize
 from rasterio.transform import from_bounds
@@ -14,12 +15,8 @@ from .colors import color_from_code
 
 
 def to_shapely_union(geojson_fc: Dict):
-    geoms = []
-    for f in geojson_fc["features"]:
-        g = shape(f["geometry"])
-        g = force_2d(g)
-        geoms.append(g)
-    return unary_union(geoms)
+    geoms = np.asarray([shape(f["geometry"]) for f in geojson_fc["features"]], dtype=object)
+    return shapely.union_all(force_2d(geoms))
 
 def bbox_3857(geom) -> Tuple[float, float, float, float]:
     minx, miny, maxx, maxy = geom.bounds
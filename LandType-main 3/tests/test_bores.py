@@ -1,3 +1,4 @@
+import base64
 import datetime as dt
 import sys
 from pathlib import Path
@@ -6,6 +7,7 @@ sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from app.bores import (  # noqa: E402
     get_bore_icon,
+    get_bore_icon_bytes,
     make_bore_icon_key,
     normalize_bore_drill_date,
     normalize_bore_number,
@@ -33,3 +35,10 @@ def test_normalize_bore_drill_date_from_epoch_ms():
     millis = int(sample.timestamp() * 1000)
     assert normalize_bore_drill_date(millis) == "1960-07-01"
 
+
+
+def test_get_bore_icon_bytes_is_predecoded():
+    icon = get_bore_icon("EX", "AB")
+    assert icon is not None and icon.image_data
+    assert get_bore_icon_bytes(" ex,ab ") == base64.b64decode(icon.image_data)
+    assert get_bore_icon_bytes("") is None
@@ -0,0 +1,118 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+import app.arcgis as arcgis  # noqa: E402
+from app.cache import TTLCache  # noqa: E402
+
+
+def test_ttl_cache_expires_and_evicts(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("app.cache.time.monotonic", lambda: clock[0])
+
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # evicts least recently used ("b")
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    clock[0] += 11
+    assert cache.get("a") is None
+    assert cache.purge() == 1
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_to_stay_under_maxbytes():
+    cache = TTLCache(maxsize=10, ttl=60, maxbytes=10)
+    cache.set("a", b"1234")
+    cache.set("b", b"5678")
+    assert cache.get("a") == b"1234"
+    cache.set("c", b"abcd")  # 12 bytes: evicts least recently used ("b")
+    assert cache.get("b") is None
+    assert cache.nbytes == 8
+    cache.set("a", b"12")
+    assert cache.nbytes == 6
+    cache.set("big", b"x" * 11)  # larger than the whole budget: not kept
+    assert cache.get("big") is None
+    assert cache.nbytes == 6 and len(cache) == 2
+
+
+class _FakeResponse:
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return {
+            "type": "FeatureCollection",
+            "features": [{"type": "Feature", "geometry": None, "properties": {"code": "A"}}],
+        }
+
+
+def test_arcgis_query_reuses_cached_response(monkeypatch):
+    calls = []
+
+    class _FakeSession:
+        def get(self, url, params=None, timeout=None):
+            calls.append(url)
+            return _FakeResponse()
+
+    monkeypatch.setattr(arcgis, "_get_session", _FakeSession)
+    monkeypatch.setattr(arcgis, "_QUERY_CACHE", TTLCache(maxsize=4, ttl=60))
+
+    env = (1000.004, 2000.0, 3000.0, 4000.0)
+    first = arcgis.fetch_features_intersecting_envelope("https://example.test/MapServer", 3, env)
+    first["features"][0]["properties"]["code"] = "mutated"
+    second = arcgis.fetch_features_intersecting_envelope(
+        "https://example.test/MapServer", 3, (1000.0, 2000.0, 3000.0, 4000.0)
+    )
+
+    assert len(calls) == 1, "rounded envelope should hit the cache"
+    assert second["features"][0]["properties"]["code"] == "A"
+
+
+def test_large_envelope_is_tiled_and_deduplicated(monkeypatch):
+    queried = []
+
+    def _fake_query(service_url, layer_id, params, paginate=True):
+        queried.append(params["geometry"])
+        return {
+            "type": "FeatureCollection",
+            "features": [
+                {"type": "Feature", "id": 1, "geometry": None, "properties": {}},
+                {"type": "Feature", "id": len(queried) + 100, "geometry": None, "properties": {}},
+            ],
+        }
+
+    monkeypatch.setattr(arcgis, "_arcgis_geojson_query", _fake_query)
+    monkeypatch.setattr(arcgis, "ARCGIS_TILE_SIZE_M", 100)
+
+    tiles = arcgis.tile_envelope((0, 0, 200, 200), 2)
+    assert tiles[0] == (0, 0, 100, 100) and tiles[-1] == (100, 100, 200, 200)
+
+    fc = arcgis.fetch_features_intersecting_envelope("https://example.test/MapServer", 0, (0, 0, 200, 200))
+    assert len(queried) == 4
+    ids = [f["id"] for f in fc["features"]]
+    assert ids.count(1) == 1
+    assert len(ids) == 5
+
+    queried.clear()
+    arcgis.fetch_features_intersecting_envelope("https://example.test/MapServer", 0, (0, 0, 50, 50))
+    assert len(queried) == 1
+
+
+def test_tile_merge_deduplicates_features_without_ids():
+    square = {"type": "Polygon", "coordinates": [[[0, 0], [0, 1], [1, 1], [1, 0], [0, 0]]]}
+    crossing = {"type": "Feature", "geometry": square, "properties": {"code": "A"}}
+    twin = {"type": "Feature", "geometry": square, "properties": {"code": "B"}}
+
+    merged = arcgis._merge_tiles(
+        [
+            {"features": [crossing, dict(crossing)]},
+            {"features": [dict(crossing), twin]},
+        ]
+    )
+
+    codes = [f["properties"]["code"] for f in merged["features"]]
+    assert codes == ["A", "A", "B"], "only repeats from earlier tiles are dropped"
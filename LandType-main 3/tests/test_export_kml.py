@@ -5,6 +5,8 @@ import pytest
 from fastapi.testclient import TestClient
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
+import app.main as main  # noqa: E402
+from app.kml import PointPlacemark, build_kml  # noqa: E402
 from app.main import app
 
 
@@ -15,3 +17,17 @@ def test_export_kml_smoke():
     assert r.status_code in (200, 404)
     if r.status_code == 200:
         assert r.headers["content-type"].startswith("application/vnd.google-earth.kml")
+
+
+def test_inline_point_icon_hrefs_rewrites_one_placemark_per_style():
+    points = [
+        PointPlacemark(name=name, lon=1.0, lat=2.0, style_id="bore-a", icon_href="icons/a.png")
+        for name in ("B1", "B2")
+    ]
+    second = points[1]
+    main._inline_point_icon_hrefs(points, {"icons/a.png": b"\x89PNG"})
+
+    assert points[0].icon_href.startswith("data:image/png;base64,")
+    assert points[1] is second
+    kml = build_kml([], color_fn=lambda code: (0, 0, 0), point_placemarks=points)
+    assert "data:image/png;base64," in kml
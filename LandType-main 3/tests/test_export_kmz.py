@@ -1,11 +1,13 @@
 import io
 import sys
+import threading
+import time
 import zipfile
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
-from shapely.geometry import Point, Polygon, mapping
+from shapely.geometry import Point, Polygon, mapping, shape
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 import app.main as main  # noqa: E402
@@ -157,3 +159,163 @@ def test_export_kmz_includes_bore_icons(monkeypatch):
         assert "<Folder><name>Water</name><Folder><name>Groundwater Bores</name>" in doc_text
         assert "<Folder><name>Test Water Layer</name>" in doc_text
         assert "Test Water Feature" in doc_text
+
+
+def test_iter_kmz_streams_valid_archive():
+    chunks = list(main.iter_kmz("<kml/>", {"icons/a.png": b"\x89PNG-data", "": b"skip"}))
+    assert len(chunks) > 1
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zf:
+        assert zf.testzip() is None
+        assert zf.read("doc.kml") == b"<kml/>"
+        assert zf.getinfo("icons/a.png").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("doc.kml").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_iter_zip_yields_each_entry_as_it_is_written():
+    produced = []
+
+    def entries():
+        for name in ("a.kmz", "b.kmz"):
+            produced.append(name)
+            yield name, name.encode() * 100
+
+    stream = main.iter_zip(entries())
+    chunks = [next(stream)]
+    assert produced == ["a.kmz"], "entries should be pulled lazily"
+    chunks.extend(stream)
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == ["a.kmz", "b.kmz"]
+        assert zf.read("b.kmz") == b"b.kmz" * 100
+
+
+def test_prepare_water_layers_filters_points_without_clipping():
+    parcel_fc = {
+        "type": "FeatureCollection",
+        "features": [{"type": "Feature", "geometry": mapping(Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])), "properties": {}}],
+    }
+    layers = [
+        {
+            "layer_id": 3,
+            "layer_title": "Springs",
+            "feature_collection": {
+                "type": "FeatureCollection",
+                "features": [
+                    {"type": "Feature", "geometry": {"type": "Point", "coordinates": [0.5, 0.5]}, "properties": {"code": "W3-1", "name": "Inside"}},
+                    {"type": "Feature", "geometry": {"type": "Point", "coordinates": [5, 5]}, "properties": {"code": "W3-2", "name": "Outside"}},
+                    {"type": "Feature", "geometry": {"type": "MultiPoint", "coordinates": [[0.2, 0.2], [9, 9]]}, "properties": {"code": "W3-3"}},
+                ],
+            },
+        }
+    ]
+
+    (layer,) = main._prepare_water_layers(parcel_fc, layers, "1/DP1")
+
+    assert [(p.name, p.lon, p.lat) for p in layer.points] == [("Inside", 0.5, 0.5), ("Springs", 0.2, 0.2)]
+    geometries = [f["geometry"] for f in layer.feature_collection["features"]]
+    assert geometries == [
+        {"type": "Point", "coordinates": [0.5, 0.5]},
+        {"type": "Point", "coordinates": [0.2, 0.2]},
+    ]
+
+
+def test_prepare_water_layers_dissolves_points_like_clipping():
+    parcel_fc = {
+        "type": "FeatureCollection",
+        "features": [{"type": "Feature", "geometry": mapping(Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])), "properties": {}}],
+    }
+    features = [
+        {"type": "Feature", "geometry": mapping(Polygon([(0.5, 0.5), (2, 0.5), (2, 2), (0.5, 2)])), "properties": {"code": "W4-1", "name": "Pond"}},
+        {"type": "Feature", "geometry": {"type": "Point", "coordinates": [0.7, 0.2]}, "properties": {"code": "W4-2", "name": "Bore"}},
+        {"type": "Feature", "geometry": {"type": "Point", "coordinates": [0.1, 0.3]}, "properties": {"code": "W4-2", "name": "Bore"}},
+        {"type": "Feature", "geometry": {"type": "Point", "coordinates": [0.4, 0.4]}, "properties": {"code": "W4-3", "name": "Spring"}},
+    ]
+    layers = [{"layer_id": 4, "layer_title": "Water", "feature_collection": {"type": "FeatureCollection", "features": features}}]
+
+    (layer,) = main._prepare_water_layers(parcel_fc, layers, "1/DP1")
+
+    expected = main.prepare_clipped_shapes(parcel_fc, {"type": "FeatureCollection", "features": features})
+    got = layer.feature_collection["features"]
+    assert [f["properties"]["code"] for f in got] == [code for _g, code, _n, _a in expected] == ["W4-1", "W4-2", "W4-3"]
+    assert [shape(f["geometry"]).equals(g) for f, (g, *_rest) in zip(got, expected)] == [True, True, True]
+    assert got[1]["geometry"]["type"] == "MultiPoint"
+    assert [(p.name, p.lon, p.lat) for p in layer.points] == [("Bore", 0.1, 0.3), ("Bore", 0.7, 0.2), ("Spring", 0.4, 0.4)]
+
+
+def test_water_layer_dates_match_per_value_formatting():
+    values = [0, 1_700_000_000_000, 1_700_000_000, -86_401, 1e30, float("nan")]
+    rows = [{"survey_date": value, "name": "x"} for value in values]
+
+    dates = main._water_layer_dates(rows)
+
+    for props in rows:
+        expected = main._format_water_value("survey_date", props["survey_date"])
+        assert dates.get(id(props), {}).get("survey_date", expected) == expected
+
+
+def test_build_reports_runs_lots_concurrently_in_order(monkeypatch):
+    threads = set()
+
+    def fake_build(lp, **kwargs):
+        threads.add(threading.current_thread().name)
+        time.sleep(0.05 if lp == "1TEST" else 0.0)
+        return lp
+
+    monkeypatch.setattr(main, "build_property_report_kmz", fake_build)
+    monkeypatch.setattr(main, "_REPORT_CACHE", main.TTLCache(maxsize=8, ttl=60))
+    reports = main._build_reports(
+        ["1TEST", "2TEST", "3TEST"],
+        simplify_tolerance=0.0,
+        veg_service_url=None,
+        veg_layer_id=None,
+        veg_name_field=None,
+        veg_code_field=None,
+    )
+    assert reports == ["1TEST", "2TEST", "3TEST"]
+    assert len(threads) > 1
+
+
+def test_property_reports_are_cached_per_lot_and_options(monkeypatch):
+    calls = []
+
+    def fake_build(lp, **kwargs):
+        calls.append((lp, kwargs["simplify_tolerance"]))
+        return (lp, kwargs["simplify_tolerance"])
+
+    monkeypatch.setattr(main, "build_property_report_kmz", fake_build)
+    monkeypatch.setattr(main, "_REPORT_CACHE", main.TTLCache(maxsize=8, ttl=60))
+    options = dict(veg_service_url=None, veg_layer_id=None, veg_name_field=None, veg_code_field=None)
+
+    first = main._cached_property_report("1TEST", simplify_tolerance=0.0, **options)
+    again = main._cached_property_report("1TEST", simplify_tolerance=0.0, **options)
+    simplified = main._cached_property_report("1TEST", simplify_tolerance=0.0001, **options)
+
+    assert again is first
+    assert simplified == ("1TEST", 0.0001)
+    assert calls == [("1TEST", 0.0), ("1TEST", 0.0001)]
+
+
+def test_report_streams_its_kmz_when_served(monkeypatch):
+    kml_text = "<kml><Document/></kml>"
+    report = main.PropertyReportKMZ(
+        lotplan="1TEST",
+        filename="Property Report – 1TEST.kmz",
+        kml_text=kml_text,
+        landtypes=(),
+        vegetation=(),
+        easements=(),
+        easement_color_map={},
+        water_layers=(),
+        bore_points=(),
+        bore_assets={"icons/a.png": b"png"},
+    )
+    assert not hasattr(report, "kmz_bytes")
+
+    stream = main.iter_zip([("a.kmz", report.iter_kmz()), ("b.kmz", report.iter_kmz())])
+    with zipfile.ZipFile(io.BytesIO(b"".join(stream))) as outer:
+        assert outer.namelist() == ["a.kmz", "b.kmz"]
+        with zipfile.ZipFile(io.BytesIO(outer.read("b.kmz"))) as kmz:
+            assert kmz.read("doc.kml").decode("utf-8") == kml_text
+            assert kmz.read("icons/a.png") == b"png"
@@ -0,0 +1,69 @@
+import sys
+from pathlib import Path
+
+from shapely.geometry import MultiPolygon, Point, Polygon, box, mapping
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from app.geometry import (  # noqa: E402
+    build_parcel_index,
+    geojson_bounds,
+    prepare_clipped_shapes,
+    total_bounds,
+)
+
+
+def test_parcel_index_clips_against_matching_parts_only():
+    parcel = MultiPolygon([box(0, 0, 1, 1), box(10, 10, 11, 11)])
+    index = build_parcel_index(parcel)
+    assert index is not None
+    assert len(index.parts) == 2
+
+    feature = box(0.5, 0.5, 2, 2)
+    assert index.candidates(feature).equals(parcel.geoms[0])
+    assert index.intersection(feature).equals(parcel.intersection(feature))
+
+    assert index.candidates(box(5, 5, 6, 6)) is None
+    assert index.intersection(box(5, 5, 6, 6)).is_empty
+    assert build_parcel_index(MultiPolygon()) is None
+
+
+def test_total_bounds_skips_empty_geometries():
+    geoms = [box(0, 0, 1, 1), Polygon(), box(5, -2, 6, 3)]
+    assert total_bounds(geoms) == (0.0, -2.0, 6.0, 3.0)
+    assert total_bounds([]) is None
+    assert total_bounds([Polygon()]) is None
+
+
+def test_parcel_index_envelope_misses():
+    index = build_parcel_index(box(0, 0, 1, 1))
+    assert index.envelope_misses(box(2, 2, 3, 3))
+    assert not index.envelope_misses(box(1, 1, 3, 3))
+
+
+def test_prepare_clipped_shapes_clips_and_dissolves_by_code():
+    parcel_fc = {"features": [{"geometry": mapping(box(150.0, -27.0, 150.01, -26.99))}]}
+    thematic_fc = {
+        "features": [
+            {"geometry": mapping(box(149.995, -27.0, 150.005, -26.99)), "properties": {"code": "A", "name": "Alpha"}},
+            {"geometry": mapping(box(150.005, -27.0, 150.02, -26.99)), "properties": {"code": "A", "name": "Alpha"}},
+            {"geometry": mapping(box(151.0, -28.0, 151.1, -27.9)), "properties": {"code": "B"}},
+            {"geometry": mapping(Point(150.002, -26.995)), "properties": {"code": "P"}},
+        ]
+    }
+
+    clipped = {code: (geom, name, area) for geom, code, name, area in prepare_clipped_shapes(parcel_fc, thematic_fc)}
+
+    assert set(clipped) == {"A", "P"}
+    geom, name, area = clipped["A"]
+    assert name == "Alpha"
+    assert geom.equals(box(150.0, -27.0, 150.01, -26.99))
+    assert 100 < area < 120  # ~0.01 deg square at this latitude
+    assert clipped["P"][2] == 0.0
+
+
+def test_geojson_bounds_matches_shapely():
+    shape = MultiPolygon([box(0, 0, 1, 1), Point(5, 5).buffer(1)])
+    assert geojson_bounds(mapping(shape)) == shape.bounds
+    assert geojson_bounds({"type": "LineString", "coordinates": [[0, 0, 9], [2, 1]]}) == (0.0, 0.0, 2.0, 1.0)
+    assert geojson_bounds({"type": "Polygon", "coordinates": []}) is None
+    assert geojson_bounds({"type": "Point", "coordinates": ["x"]}) is None
@@ -1,4 +1,6 @@
+import json
 import sys
+import threading
 from pathlib import Path
 
 import pytest
@@ -9,6 +11,37 @@ sys.path.append(str(Path(__file__).resolve().parents[1]))
 import app.main as main  # noqa: E402
 from app.main import app
 
+EMPTY_FC = {"type": "FeatureCollection", "features": []}
+
+
+@pytest.fixture
+def stub_layers(monkeypatch):
+    """Point the parcel and four envelope fetchers at fixture data.
+
+    ``parcel`` is one geometry, or a mapping of lotplan to geometry for bulk requests.
+    ``landtypes`` may be a callable taking the envelope, to observe the queries made.
+    """
+
+    def stub(parcel, *, landtypes=EMPTY_FC, bores=EMPTY_FC, easements=EMPTY_FC, water=()):
+        def fetch_parcel(lp):
+            geom = parcel[lp] if isinstance(parcel, dict) else parcel
+            return {
+                "type": "FeatureCollection",
+                "features": [{"type": "Feature", "geometry": mapping(geom), "properties": {}}],
+            }
+
+        monkeypatch.setattr(main, "fetch_parcel_geojson", fetch_parcel)
+        monkeypatch.setattr(
+            main,
+            "fetch_landtypes_intersecting_envelope",
+            landtypes if callable(landtypes) else (lambda env: landtypes),
+        )
+        monkeypatch.setattr(main, "fetch_bores_intersecting_envelope", lambda env: bores)
+        monkeypatch.setattr(main, "fetch_easements_intersecting_envelope", lambda env: easements)
+        monkeypatch.setattr(main, "fetch_water_layers_intersecting_envelope", lambda env: list(water))
+
+    return stub
+
 
 @pytest.mark.integration
 def test_vector_smoke():
@@ -107,3 +140,202 @@ def test_vector_includes_water_layers(monkeypatch):
     assert layer_entry["layer_title"] == "Water Layer"
     features = layer_entry.get("features", {}).get("features", [])
     assert features and features[0]["properties"]["name"] == "Water Test"
+
+
+def test_vector_bulk_assembles_lots_in_request_order(stub_layers):
+    stub_layers(
+        {
+            "1/TEST": Polygon([(0, 0), (0, 1), (1, 1), (1, 0)]),
+            "2/TEST": Polygon([(2, 0), (2, 1), (3, 1), (3, 0)]),
+        }
+    )
+
+    client = TestClient(app)
+    response = client.post("/vector/bulk", json={"lotplans": ["2/TEST", "1/TEST"]})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["lotplans"] == ["2/TEST", "1/TEST"]
+    assert [f["properties"]["lotplan"] for f in data["parcels"]["features"]] == ["2/TEST", "1/TEST"]
+    assert data["bounds4326"] == {"west": 0.0, "south": 0.0, "east": 3.0, "north": 1.0}
+
+
+def test_vector_bulk_batches_clustered_lots(stub_layers):
+    squares = {
+        "1/TEST": Polygon([(0, 0), (0, 0.001), (0.001, 0.001), (0.001, 0)]),
+        "2/TEST": Polygon([(0.002, 0), (0.002, 0.001), (0.003, 0.001), (0.003, 0)]),
+    }
+    landtype_fc = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": mapping(squares["2/TEST"].buffer(0.0001)),
+                "properties": {"code": "LT2", "name": "Only lot two"},
+            }
+        ],
+    }
+    calls = []
+
+    def fake_landtypes(env):
+        calls.append(env)
+        return landtype_fc
+
+    stub_layers(squares, landtypes=fake_landtypes)
+
+    client = TestClient(app)
+    response = client.post("/vector/bulk", json={"lotplans": ["1/TEST", "2/TEST"]})
+    assert response.status_code == 200
+    assert len(calls) == 1, "clustered lots should share one land type query"
+    landtypes = response.json()["landtypes"]["features"]
+    assert [f["properties"]["lotplan"] for f in landtypes] == ["2/TEST"]
+
+
+def test_vector_simplify_tolerance_reduces_vertices(stub_layers):
+    parcel = Polygon([(0, 0), (0, 0.01), (0.01, 0.01), (0.01, 0)])
+    wiggly = Polygon([(0.003, 0.003), (0.003, 0.007), (0.007, 0.007), (0.007, 0.003)]).buffer(0.002, quad_segs=64)
+    stub_layers(
+        parcel,
+        landtypes={
+            "type": "FeatureCollection",
+            "features": [{"type": "Feature", "geometry": mapping(wiggly), "properties": {"code": "LT1"}}],
+        },
+    )
+
+    client = TestClient(app)
+    full = client.get("/vector", params={"lotplan": "1TEST"}).json()
+    simple = client.get("/vector", params={"lotplan": "1TEST", "simplify_tolerance": 0.0005}).json()
+
+    def vertex_count(data):
+        return len(data["landtypes"]["features"][0]["geometry"]["coordinates"][0])
+
+    assert vertex_count(simple) < vertex_count(full)
+    assert simple["legend"] == full["legend"]
+
+
+def test_vector_bulk_honours_simplify_tolerance(stub_layers):
+    parcel = Polygon([(0, 0), (0, 0.01), (0.01, 0.01), (0.01, 0)])
+    wiggly = Polygon([(0.003, 0.003), (0.003, 0.007), (0.007, 0.007), (0.007, 0.003)]).buffer(0.002, quad_segs=64)
+    stub_layers(
+        parcel,
+        landtypes={
+            "type": "FeatureCollection",
+            "features": [{"type": "Feature", "geometry": mapping(wiggly), "properties": {"code": "LT1"}}],
+        },
+    )
+
+    client = TestClient(app)
+    full = client.post("/vector/bulk", json={"lotplans": ["1/TEST"]}).json()
+    simple = client.post("/vector/bulk", json={"lotplans": ["1/TEST"], "simplify_tolerance": 0.0005}).json()
+
+    def vertex_count(data):
+        return len(data["landtypes"]["features"][0]["geometry"]["coordinates"][0])
+
+    assert vertex_count(simple) < vertex_count(full)
+    assert client.post("/vector/bulk", json={"lotplans": ["1/TEST"], "simplify_tolerance": 0.01}).status_code == 422
+
+
+def test_vector_etag_revalidates_with_304(monkeypatch, stub_layers):
+    polygon = Polygon([(0, 0), (0, 1), (1, 1), (1, 0)])
+    stub_layers(polygon)
+    monkeypatch.setattr(main, "prepare_clipped_shapes", lambda parcel, thematic: [(polygon, "LT1", "One", 1.0)])
+
+    client = TestClient(app)
+    first = client.get("/vector", params={"lotplan": "1TEST"})
+    etag = first.headers["etag"]
+    again = client.get("/vector", params={"lotplan": "1TEST"}, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.headers["etag"] == etag
+    assert not again.content
+    assert etag.startswith('W/"')
+    identity = client.get("/vector", params={"lotplan": "1TEST"}, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+    for resp in (first, again, identity):
+        assert [t.strip() for t in resp.headers["vary"].split(",")].count("Accept-Encoding") == 1
+
+
+def test_vector_fetches_envelope_layers_concurrently(monkeypatch, stub_layers):
+    polygon = Polygon([(0, 0), (0, 1), (1, 1), (1, 0)])
+    stub_layers(polygon)
+    barrier = threading.Barrier(4, timeout=5)
+
+    def meet(result):
+        def fetch(env):
+            barrier.wait()
+            return result
+
+        return fetch
+
+    monkeypatch.setattr(main, "fetch_landtypes_intersecting_envelope", meet(EMPTY_FC))
+    monkeypatch.setattr(main, "fetch_bores_intersecting_envelope", meet(EMPTY_FC))
+    monkeypatch.setattr(main, "fetch_easements_intersecting_envelope", meet(EMPTY_FC))
+    monkeypatch.setattr(main, "fetch_water_layers_intersecting_envelope", meet([]))
+
+    response = TestClient(app).get("/vector", params={"lotplan": "1TEST"})
+    assert response.status_code == 404
+    assert not barrier.broken
+
+
+def test_etag_matches_whole_tags_only():
+    etag = '"abc123"'
+    assert main._etag_matches('"abc123"', etag)
+    assert main._etag_matches('"zzz", W/"abc123"', etag)
+    assert main._etag_matches("*", etag)
+    assert not main._etag_matches('"abc1234"', etag)
+    assert not main._etag_matches('"xabc123", "abc"', etag)
+    assert not main._etag_matches("", etag)
+    assert main._etag_matches('"abc123"', 'W/"abc123"')
+
+
+def test_vector_drops_unparseable_bore_geometries(monkeypatch, stub_layers):
+    polygon = Polygon([(0, 0), (0, 1), (1, 1), (1, 0)])
+    bore_fc = {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "geometry": {"type": "Bogus"}, "properties": {"rn_char": "B1"}},
+            {"type": "Feature", "geometry": None, "properties": {"rn_char": "B2"}},
+            {"type": "Feature", "geometry": {"type": "Point", "coordinates": [0.5, 0.5]}, "properties": {"rn_char": "B1"}},
+        ],
+    }
+    stub_layers(polygon, bores=bore_fc)
+    monkeypatch.setattr(main, "prepare_clipped_shapes", lambda parcel, thematic: [(polygon, "LT1", "One", 1.0)])
+
+    data = TestClient(app).get("/vector", params={"lotplan": "1TEST"}).json()
+    bores = data["bores"]["features"]
+    assert [f["properties"]["bore_number"] for f in bores] == ["B1"]
+    assert bores[0]["geometry"] == {"type": "Point", "coordinates": [0.5, 0.5]}
+
+
+def test_landtype_features_serialize_clipped_geometries():
+    square = Polygon([(0, 0), (0, 1), (1, 1), (1, 0)])
+    features, bounds, _legend = main._landtype_features([(square, "A", "Alpha", 1.0)], "1TEST")
+    assert features[0]["geometry"] == json.loads(json.dumps(mapping(square)))
+    assert features[0]["properties"]["lotplan"] == "1TEST"
+    assert bounds == (0.0, 0.0, 1.0, 1.0)
+
+
+def test_landtype_legend_totals_areas_per_code():
+    legend = main._landtype_legend(
+        [(None, "B", "First B", 1.0), (None, "A", "A", 2.0), (None, "B", "Second B", 1.5)]
+    )
+    assert [(row["code"], row["name"], row["area_ha"]) for row in legend] == [
+        ("B", "First B", 2.5),
+        ("A", "A", 2.0),
+    ]
+    assert main._landtype_legend([]) == []
+
+
+def test_clip_array_to_parcel_settles_inside_and_disjoint_without_overlay():
+    parcel = Polygon([(0, 0), (0, 2), (2, 2), (2, 0)])
+    index = main.build_parcel_index(parcel)
+    inside = Polygon([(0.5, 0.5), (0.5, 1), (1, 1), (1, 0.5)])
+    crossing = Polygon([(1, 1), (1, 3), (3, 3), (3, 1)])
+    disjoint = Polygon([(5, 5), (5, 6), (6, 6), (6, 5)])
+    geoms = main._geometries_from_features(
+        [{"geometry": mapping(g)} for g in (inside, crossing, disjoint)] + [{"geometry": None}]
+    )
+
+    out = main._clip_array_to_parcel(geoms, index)
+
+    assert out[0].equals(inside)
+    assert out[1].equals(Polygon([(1, 1), (1, 2), (2, 2), (2, 1)]))
+    assert out[2] is None and out[3] is None